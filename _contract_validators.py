@@ -0,0 +1,539 @@
+"""Contract validators generated by tools/gen_validators.py. Do not edit."""
+# mypy: ignore-errors
+# ruff: noqa
+# fmt: off
+import re
+from decimal import Decimal
+
+from fastjsonschema import (
+    JsonSchemaValueException,
+    JsonSchemaValuesException,
+)
+
+FASTJSONSCHEMA_VERSION = "2.22.2"
+SCHEMA_FINGERPRINTS = {'input': '2eb180aba475f0166793f45d161c7f6d76b63a0d22d4f31f1b64f63317fb92c3', 'output': 'bfc3781c12dedea6a292fff5f624feee1cac885e6ec3e05ada1bb5be44606df6', 'error': 'c7b3197f6b5dbbd9475bd3047be1779ea164eb1b4e4728bef3a28896119f9489'}
+
+NoneType = type(None)
+
+
+_INPUT_ALLOWED_KEYS_0 = frozenset(('command', 'parameters'))
+_INPUT_ALLOWED_KEYS_1 = frozenset(('entries', 'repo_parent_root', 'token_env', 'context', 'publisher_factory'))
+_INPUT_ALLOWED_KEYS_2 = frozenset(('package', 'version', 'ancillary', 'options'))
+_INPUT_ALLOWED_KEYS_3 = frozenset(('author', 'email', 'description', 'license_text', 'dependencies', 'pypi_name', 'ancillary_allowlist', 'ancillary_list', 'extra'))
+
+_INPUT_REQUIRED_0 = frozenset(('command', 'parameters'))
+_INPUT_REQUIRED_1 = frozenset(('entries', 'repo_parent_root'))
+_INPUT_REQUIRED_2 = frozenset(('package', 'version'))
+def validate_input(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition=None, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        if not data.keys() >= _INPUT_REQUIRED_0:
+            data__missing_keys = _INPUT_REQUIRED_0 - data.keys()
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition=None, rule='required')
+        data_keys = data.keys()
+        if "command" in data_keys:
+            data__command = data["command"]
+            if not (isinstance(data__command, str) and data__command == 'x_make_pypi_x'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".command must be same as const definition: x_make_pypi_x", value=data__command, name="" + (name_prefix or "data") + ".command", definition=None, rule='const')
+        if "parameters" in data_keys:
+            data__parameters = data["parameters"]
+            if not isinstance(data__parameters, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".parameters must be object", value=data__parameters, name="" + (name_prefix or "data") + ".parameters", definition=None, rule='type')
+            data__parameters_is_dict = isinstance(data__parameters, dict)
+            if data__parameters_is_dict:
+                if not data__parameters.keys() >= _INPUT_REQUIRED_1:
+                    data__parameters__missing_keys = _INPUT_REQUIRED_1 - data__parameters.keys()
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".parameters must contain " + (str(sorted(data__parameters__missing_keys)) + " properties"), value=data__parameters, name="" + (name_prefix or "data") + ".parameters", definition=None, rule='required')
+                data__parameters_keys = data__parameters.keys()
+                if "entries" in data__parameters_keys:
+                    data__parameters__entries = data__parameters["entries"]
+                    if not isinstance(data__parameters__entries, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".parameters.entries must be array", value=data__parameters__entries, name="" + (name_prefix or "data") + ".parameters.entries", definition=None, rule='type')
+                    data__parameters__entries_is_list = isinstance(data__parameters__entries, (list, tuple))
+                    if data__parameters__entries_is_list:
+                        data__parameters__entries_len = len(data__parameters__entries)
+                        if data__parameters__entries_len < 1:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".parameters.entries must contain at least 1 items", value=data__parameters__entries, name="" + (name_prefix or "data") + ".parameters.entries", definition=None, rule='minItems')
+                        for data__parameters__entries_x, data__parameters__entries_item in enumerate(data__parameters__entries):
+                            if not isinstance(data__parameters__entries_item, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}]".format(**locals()) + " must be object", value=data__parameters__entries_item, name="" + (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}]".format(**locals()) + "", definition=None, rule='type')
+                            data__parameters__entries_item_is_dict = isinstance(data__parameters__entries_item, dict)
+                            if data__parameters__entries_item_is_dict:
+                                if not data__parameters__entries_item.keys() >= _INPUT_REQUIRED_2:
+                                    data__parameters__entries_item__missing_keys = _INPUT_REQUIRED_2 - data__parameters__entries_item.keys()
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}]".format(**locals()) + " must contain " + (str(sorted(data__parameters__entries_item__missing_keys)) + " properties"), value=data__parameters__entries_item, name="" + (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}]".format(**locals()) + "", definition=None, rule='required')
+                                data__parameters__entries_item_keys = data__parameters__entries_item.keys()
+                                if "package" in data__parameters__entries_item_keys:
+                                    data__parameters__entries_item__package = data__parameters__entries_item["package"]
+                                    validate_input____defs_nonemptystring(data__parameters__entries_item__package, custom_formats, (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}].package".format(**locals()))
+                                if "version" in data__parameters__entries_item_keys:
+                                    data__parameters__entries_item__version = data__parameters__entries_item["version"]
+                                    validate_input____defs_nonemptystring(data__parameters__entries_item__version, custom_formats, (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}].version".format(**locals()))
+                                if "ancillary" in data__parameters__entries_item_keys:
+                                    data__parameters__entries_item__ancillary = data__parameters__entries_item["ancillary"]
+                                    validate_input____defs_stringarray(data__parameters__entries_item__ancillary, custom_formats, (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}].ancillary".format(**locals()))
+                                if "options" in data__parameters__entries_item_keys:
+                                    data__parameters__entries_item__options = data__parameters__entries_item["options"]
+                                    if not isinstance(data__parameters__entries_item__options, (dict)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}].options".format(**locals()) + " must be object", value=data__parameters__entries_item__options, name="" + (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}].options".format(**locals()) + "", definition=None, rule='type')
+                                    data__parameters__entries_item__options_is_dict = isinstance(data__parameters__entries_item__options, dict)
+                                    if data__parameters__entries_item__options_is_dict:
+                                        data__parameters__entries_item__options_keys = data__parameters__entries_item__options.keys()
+                                        if "author" in data__parameters__entries_item__options_keys:
+                                            data__parameters__entries_item__options__author = data__parameters__entries_item__options["author"]
+                                            validate_input____defs_nullablestring(data__parameters__entries_item__options__author, custom_formats, (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}].options.author".format(**locals()))
+                                        if "email" in data__parameters__entries_item__options_keys:
+                                            data__parameters__entries_item__options__email = data__parameters__entries_item__options["email"]
+                                            validate_input____defs_nullablestring(data__parameters__entries_item__options__email, custom_formats, (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}].options.email".format(**locals()))
+                                        if "description" in data__parameters__entries_item__options_keys:
+                                            data__parameters__entries_item__options__description = data__parameters__entries_item__options["description"]
+                                            validate_input____defs_nullablestring(data__parameters__entries_item__options__description, custom_formats, (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}].options.description".format(**locals()))
+                                        if "license_text" in data__parameters__entries_item__options_keys:
+                                            data__parameters__entries_item__options__licensetext = data__parameters__entries_item__options["license_text"]
+                                            validate_input____defs_nullablestring(data__parameters__entries_item__options__licensetext, custom_formats, (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}].options.license_text".format(**locals()))
+                                        if "dependencies" in data__parameters__entries_item__options_keys:
+                                            data__parameters__entries_item__options__dependencies = data__parameters__entries_item__options["dependencies"]
+                                            validate_input____defs_stringarray(data__parameters__entries_item__options__dependencies, custom_formats, (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}].options.dependencies".format(**locals()))
+                                        if "pypi_name" in data__parameters__entries_item__options_keys:
+                                            data__parameters__entries_item__options__pypiname = data__parameters__entries_item__options["pypi_name"]
+                                            validate_input____defs_nullablestring(data__parameters__entries_item__options__pypiname, custom_formats, (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}].options.pypi_name".format(**locals()))
+                                        if "ancillary_allowlist" in data__parameters__entries_item__options_keys:
+                                            data__parameters__entries_item__options__ancillaryallowlist = data__parameters__entries_item__options["ancillary_allowlist"]
+                                            validate_input____defs_stringarray(data__parameters__entries_item__options__ancillaryallowlist, custom_formats, (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}].options.ancillary_allowlist".format(**locals()))
+                                        if "ancillary_list" in data__parameters__entries_item__options_keys:
+                                            data__parameters__entries_item__options__ancillarylist = data__parameters__entries_item__options["ancillary_list"]
+                                            validate_input____defs_stringarray(data__parameters__entries_item__options__ancillarylist, custom_formats, (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}].options.ancillary_list".format(**locals()))
+                                        if "extra" in data__parameters__entries_item__options_keys:
+                                            data__parameters__entries_item__options__extra = data__parameters__entries_item__options["extra"]
+                                            if not isinstance(data__parameters__entries_item__options__extra, (dict)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}].options.extra".format(**locals()) + " must be object", value=data__parameters__entries_item__options__extra, name="" + (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}].options.extra".format(**locals()) + "", definition=None, rule='type')
+                                            data__parameters__entries_item__options__extra_is_dict = isinstance(data__parameters__entries_item__options__extra, dict)
+                                            if data__parameters__entries_item__options__extra_is_dict:
+                                                data__parameters__entries_item__options__extra_keys = set(data__parameters__entries_item__options__extra.keys())
+                                        data__parameters__entries_item__options_keys_unknown = data__parameters__entries_item__options_keys - _INPUT_ALLOWED_KEYS_3
+                                        if data__parameters__entries_item__options_keys_unknown:
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}].options".format(**locals()) + " must not contain "+str(data__parameters__entries_item__options_keys_unknown)+" properties", value=data__parameters__entries_item__options, name="" + (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}].options".format(**locals()) + "", definition=None, rule='additionalProperties')
+                                data__parameters__entries_item_keys_unknown = data__parameters__entries_item_keys - _INPUT_ALLOWED_KEYS_2
+                                if data__parameters__entries_item_keys_unknown:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}]".format(**locals()) + " must not contain "+str(data__parameters__entries_item_keys_unknown)+" properties", value=data__parameters__entries_item, name="" + (name_prefix or "data") + ".parameters.entries[{data__parameters__entries_x}]".format(**locals()) + "", definition=None, rule='additionalProperties')
+                if "repo_parent_root" in data__parameters_keys:
+                    data__parameters__repoparentroot = data__parameters["repo_parent_root"]
+                    validate_input____defs_nonemptystring(data__parameters__repoparentroot, custom_formats, (name_prefix or "data") + ".parameters.repo_parent_root")
+                if "token_env" in data__parameters_keys:
+                    data__parameters__tokenenv = data__parameters["token_env"]
+                    validate_input____defs_nonemptystring(data__parameters__tokenenv, custom_formats, (name_prefix or "data") + ".parameters.token_env")
+                if "context" in data__parameters_keys:
+                    data__parameters__context = data__parameters["context"]
+                    if not isinstance(data__parameters__context, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".parameters.context must be object", value=data__parameters__context, name="" + (name_prefix or "data") + ".parameters.context", definition=None, rule='type')
+                    data__parameters__context_is_dict = isinstance(data__parameters__context, dict)
+                    if data__parameters__context_is_dict:
+                        data__parameters__context_keys = set(data__parameters__context.keys())
+                if "publisher_factory" in data__parameters_keys:
+                    data__parameters__publisherfactory = data__parameters["publisher_factory"]
+                    validate_input____defs_nonemptystring(data__parameters__publisherfactory, custom_formats, (name_prefix or "data") + ".parameters.publisher_factory")
+                data__parameters_keys_unknown = data__parameters_keys - _INPUT_ALLOWED_KEYS_1
+                if data__parameters_keys_unknown:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".parameters must not contain "+str(data__parameters_keys_unknown)+" properties", value=data__parameters, name="" + (name_prefix or "data") + ".parameters", definition=None, rule='additionalProperties')
+        data_keys_unknown = data_keys - _INPUT_ALLOWED_KEYS_0
+        if data_keys_unknown:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys_unknown)+" properties", value=data, name="" + (name_prefix or "data") + "", definition=None, rule='additionalProperties')
+    return data
+
+def validate_input____defs_nullablestring(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (str, NoneType)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be string or null", value=data, name="" + (name_prefix or "data") + "", definition=None, rule='type')
+    if isinstance(data, str):
+        data_len = len(data)
+        if data_len < 1:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must be longer than or equal to 1 characters", value=data, name="" + (name_prefix or "data") + "", definition=None, rule='minLength')
+    return data
+
+def validate_input____defs_stringarray(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (list, tuple)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be array", value=data, name="" + (name_prefix or "data") + "", definition=None, rule='type')
+    data_is_list = isinstance(data, (list, tuple))
+    if data_is_list:
+        data_len = len(data)
+        for data_x, data_item in enumerate(data):
+            validate_input____defs_nonemptystring(data_item, custom_formats, (name_prefix or "data") + "[{data_x}]".format(**locals()))
+    return data
+
+def validate_input____defs_nonemptystring(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (str)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be string", value=data, name="" + (name_prefix or "data") + "", definition=None, rule='type')
+    if isinstance(data, str):
+        data_len = len(data)
+        if data_len < 1:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must be longer than or equal to 1 characters", value=data, name="" + (name_prefix or "data") + "", definition=None, rule='minLength')
+    return data
+
+
+_OUTPUT_ALLOWED_KEYS_0 = frozenset(('run_id', 'started_at', 'inputs', 'execution', 'result', 'status', 'errors', 'completed_at', 'duration_seconds', 'tool', 'generated_at'))
+_OUTPUT_ALLOWED_KEYS_1 = frozenset(('entry_count', 'manifest_entries', 'repo_parent_root', 'token_env'))
+_OUTPUT_ALLOWED_KEYS_2 = frozenset(('package', 'version', 'pypi_name', 'ancillary', 'options_kwargs'))
+_OUTPUT_ALLOWED_KEYS_3 = frozenset(('publisher_factory',))
+_OUTPUT_ALLOWED_KEYS_4 = frozenset(('status', 'entries', 'published_versions', 'published_artifacts'))
+_OUTPUT_ALLOWED_KEYS_5 = frozenset(('package', 'distribution', 'version', 'main_file', 'ancillary_publish', 'ancillary_manifest', 'package_dir', 'safe_kwargs', 'status', 'skip_reason', 'error'))
+_OUTPUT_ALLOWED_KEYS_6 = frozenset(('main', 'anc'))
+
+_OUTPUT_REQUIRED_0 = frozenset(('run_id', 'started_at', 'inputs', 'execution', 'result', 'status', 'completed_at', 'duration_seconds', 'tool', 'generated_at'))
+_OUTPUT_REQUIRED_1 = frozenset(('entry_count', 'manifest_entries', 'repo_parent_root'))
+_OUTPUT_REQUIRED_2 = frozenset(('package', 'version', 'pypi_name', 'ancillary', 'options_kwargs'))
+_OUTPUT_REQUIRED_3 = frozenset(('publisher_factory',))
+_OUTPUT_REQUIRED_4 = frozenset(('status', 'entries', 'published_versions', 'published_artifacts'))
+_OUTPUT_REQUIRED_5 = frozenset(('package', 'distribution', 'version', 'main_file', 'ancillary_publish', 'ancillary_manifest', 'package_dir', 'safe_kwargs', 'status'))
+_OUTPUT_REQUIRED_6 = frozenset(('main', 'anc'))
+_OUTPUT_REQUIRED_7 = frozenset(('type', 'message'))
+_OUTPUT_ENUM_0 = frozenset(('completed', 'attention', 'error', 'running'))
+_OUTPUT_ENUM_1 = frozenset(('pending', 'published', 'skipped_existing', 'error'))
+def validate_output(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition=None, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        if not data.keys() >= _OUTPUT_REQUIRED_0:
+            data__missing_keys = _OUTPUT_REQUIRED_0 - data.keys()
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition=None, rule='required')
+        data_keys = data.keys()
+        if "run_id" in data_keys:
+            data__runid = data["run_id"]
+            if not isinstance(data__runid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".run_id must be string", value=data__runid, name="" + (name_prefix or "data") + ".run_id", definition=None, rule='type')
+            if isinstance(data__runid, str):
+                data__runid_len = len(data__runid)
+                if data__runid_len < 32:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".run_id must be longer than or equal to 32 characters", value=data__runid, name="" + (name_prefix or "data") + ".run_id", definition=None, rule='minLength')
+                if data__runid_len > 32:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".run_id must be shorter than or equal to 32 characters", value=data__runid, name="" + (name_prefix or "data") + ".run_id", definition=None, rule='maxLength')
+                if not custom_formats["run_id"](data__runid):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".run_id must be run_id", value=data__runid, name="" + (name_prefix or "data") + ".run_id", definition=None, rule='format')
+        if "started_at" in data_keys:
+            data__startedat = data["started_at"]
+            if not isinstance(data__startedat, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".started_at must be string", value=data__startedat, name="" + (name_prefix or "data") + ".started_at", definition=None, rule='type')
+            if isinstance(data__startedat, str):
+                if not custom_formats["date-time"](data__startedat):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".started_at must be date-time", value=data__startedat, name="" + (name_prefix or "data") + ".started_at", definition=None, rule='format')
+        if "inputs" in data_keys:
+            data__inputs = data["inputs"]
+            if not isinstance(data__inputs, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".inputs must be object", value=data__inputs, name="" + (name_prefix or "data") + ".inputs", definition=None, rule='type')
+            data__inputs_is_dict = isinstance(data__inputs, dict)
+            if data__inputs_is_dict:
+                if not data__inputs.keys() >= _OUTPUT_REQUIRED_1:
+                    data__inputs__missing_keys = _OUTPUT_REQUIRED_1 - data__inputs.keys()
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".inputs must contain " + (str(sorted(data__inputs__missing_keys)) + " properties"), value=data__inputs, name="" + (name_prefix or "data") + ".inputs", definition=None, rule='required')
+                data__inputs_keys = data__inputs.keys()
+                if "entry_count" in data__inputs_keys:
+                    data__inputs__entrycount = data__inputs["entry_count"]
+                    if not isinstance(data__inputs__entrycount, (int)) and not (isinstance(data__inputs__entrycount, float) and data__inputs__entrycount.is_integer()) or isinstance(data__inputs__entrycount, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".inputs.entry_count must be integer", value=data__inputs__entrycount, name="" + (name_prefix or "data") + ".inputs.entry_count", definition=None, rule='type')
+                    if isinstance(data__inputs__entrycount, (int, float, Decimal)):
+                        if data__inputs__entrycount < 0:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".inputs.entry_count must be bigger than or equal to 0", value=data__inputs__entrycount, name="" + (name_prefix or "data") + ".inputs.entry_count", definition=None, rule='minimum')
+                if "manifest_entries" in data__inputs_keys:
+                    data__inputs__manifestentries = data__inputs["manifest_entries"]
+                    if not isinstance(data__inputs__manifestentries, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".inputs.manifest_entries must be array", value=data__inputs__manifestentries, name="" + (name_prefix or "data") + ".inputs.manifest_entries", definition=None, rule='type')
+                    data__inputs__manifestentries_is_list = isinstance(data__inputs__manifestentries, (list, tuple))
+                    if data__inputs__manifestentries_is_list:
+                        data__inputs__manifestentries_len = len(data__inputs__manifestentries)
+                        for data__inputs__manifestentries_x, data__inputs__manifestentries_item in enumerate(data__inputs__manifestentries):
+                            if not isinstance(data__inputs__manifestentries_item, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".inputs.manifest_entries[{data__inputs__manifestentries_x}]".format(**locals()) + " must be object", value=data__inputs__manifestentries_item, name="" + (name_prefix or "data") + ".inputs.manifest_entries[{data__inputs__manifestentries_x}]".format(**locals()) + "", definition=None, rule='type')
+                            data__inputs__manifestentries_item_is_dict = isinstance(data__inputs__manifestentries_item, dict)
+                            if data__inputs__manifestentries_item_is_dict:
+                                if not data__inputs__manifestentries_item.keys() >= _OUTPUT_REQUIRED_2:
+                                    data__inputs__manifestentries_item__missing_keys = _OUTPUT_REQUIRED_2 - data__inputs__manifestentries_item.keys()
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".inputs.manifest_entries[{data__inputs__manifestentries_x}]".format(**locals()) + " must contain " + (str(sorted(data__inputs__manifestentries_item__missing_keys)) + " properties"), value=data__inputs__manifestentries_item, name="" + (name_prefix or "data") + ".inputs.manifest_entries[{data__inputs__manifestentries_x}]".format(**locals()) + "", definition=None, rule='required')
+                                data__inputs__manifestentries_item_keys = data__inputs__manifestentries_item.keys()
+                                if "package" in data__inputs__manifestentries_item_keys:
+                                    data__inputs__manifestentries_item__package = data__inputs__manifestentries_item["package"]
+                                    validate_output____defs_nonemptystring(data__inputs__manifestentries_item__package, custom_formats, (name_prefix or "data") + ".inputs.manifest_entries[{data__inputs__manifestentries_x}].package".format(**locals()))
+                                if "version" in data__inputs__manifestentries_item_keys:
+                                    data__inputs__manifestentries_item__version = data__inputs__manifestentries_item["version"]
+                                    validate_output____defs_nonemptystring(data__inputs__manifestentries_item__version, custom_formats, (name_prefix or "data") + ".inputs.manifest_entries[{data__inputs__manifestentries_x}].version".format(**locals()))
+                                if "pypi_name" in data__inputs__manifestentries_item_keys:
+                                    data__inputs__manifestentries_item__pypiname = data__inputs__manifestentries_item["pypi_name"]
+                                    validate_output____defs_nonemptystring(data__inputs__manifestentries_item__pypiname, custom_formats, (name_prefix or "data") + ".inputs.manifest_entries[{data__inputs__manifestentries_x}].pypi_name".format(**locals()))
+                                if "ancillary" in data__inputs__manifestentries_item_keys:
+                                    data__inputs__manifestentries_item__ancillary = data__inputs__manifestentries_item["ancillary"]
+                                    validate_output____defs_stringarray(data__inputs__manifestentries_item__ancillary, custom_formats, (name_prefix or "data") + ".inputs.manifest_entries[{data__inputs__manifestentries_x}].ancillary".format(**locals()))
+                                if "options_kwargs" in data__inputs__manifestentries_item_keys:
+                                    data__inputs__manifestentries_item__optionskwargs = data__inputs__manifestentries_item["options_kwargs"]
+                                    pass
+                                data__inputs__manifestentries_item_keys_unknown = data__inputs__manifestentries_item_keys - _OUTPUT_ALLOWED_KEYS_2
+                                if data__inputs__manifestentries_item_keys_unknown:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".inputs.manifest_entries[{data__inputs__manifestentries_x}]".format(**locals()) + " must not contain "+str(data__inputs__manifestentries_item_keys_unknown)+" properties", value=data__inputs__manifestentries_item, name="" + (name_prefix or "data") + ".inputs.manifest_entries[{data__inputs__manifestentries_x}]".format(**locals()) + "", definition=None, rule='additionalProperties')
+                if "repo_parent_root" in data__inputs_keys:
+                    data__inputs__repoparentroot = data__inputs["repo_parent_root"]
+                    validate_output____defs_nonemptystring(data__inputs__repoparentroot, custom_formats, (name_prefix or "data") + ".inputs.repo_parent_root")
+                if "token_env" in data__inputs_keys:
+                    data__inputs__tokenenv = data__inputs["token_env"]
+                    validate_output____defs_nonemptystring(data__inputs__tokenenv, custom_formats, (name_prefix or "data") + ".inputs.token_env")
+                data__inputs_keys_unknown = data__inputs_keys - _OUTPUT_ALLOWED_KEYS_1
+                if data__inputs_keys_unknown:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".inputs must not contain "+str(data__inputs_keys_unknown)+" properties", value=data__inputs, name="" + (name_prefix or "data") + ".inputs", definition=None, rule='additionalProperties')
+        if "execution" in data_keys:
+            data__execution = data["execution"]
+            if not isinstance(data__execution, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".execution must be object", value=data__execution, name="" + (name_prefix or "data") + ".execution", definition=None, rule='type')
+            data__execution_is_dict = isinstance(data__execution, dict)
+            if data__execution_is_dict:
+                if not data__execution.keys() >= _OUTPUT_REQUIRED_3:
+                    data__execution__missing_keys = _OUTPUT_REQUIRED_3 - data__execution.keys()
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".execution must contain " + (str(sorted(data__execution__missing_keys)) + " properties"), value=data__execution, name="" + (name_prefix or "data") + ".execution", definition=None, rule='required')
+                data__execution_keys = data__execution.keys()
+                if "publisher_factory" in data__execution_keys:
+                    data__execution__publisherfactory = data__execution["publisher_factory"]
+                    validate_output____defs_nonemptystring(data__execution__publisherfactory, custom_formats, (name_prefix or "data") + ".execution.publisher_factory")
+                data__execution_keys_unknown = data__execution_keys - _OUTPUT_ALLOWED_KEYS_3
+                if data__execution_keys_unknown:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".execution must not contain "+str(data__execution_keys_unknown)+" properties", value=data__execution, name="" + (name_prefix or "data") + ".execution", definition=None, rule='additionalProperties')
+        if "result" in data_keys:
+            data__result = data["result"]
+            if not isinstance(data__result, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".result must be object", value=data__result, name="" + (name_prefix or "data") + ".result", definition=None, rule='type')
+            data__result_is_dict = isinstance(data__result, dict)
+            if data__result_is_dict:
+                if not data__result.keys() >= _OUTPUT_REQUIRED_4:
+                    data__result__missing_keys = _OUTPUT_REQUIRED_4 - data__result.keys()
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".result must contain " + (str(sorted(data__result__missing_keys)) + " properties"), value=data__result, name="" + (name_prefix or "data") + ".result", definition=None, rule='required')
+                data__result_keys = data__result.keys()
+                if "status" in data__result_keys:
+                    data__result__status = data__result["status"]
+                    if not isinstance(data__result__status, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".result.status must be string", value=data__result__status, name="" + (name_prefix or "data") + ".result.status", definition=None, rule='type')
+                    if not (isinstance(data__result__status, str) and data__result__status in _OUTPUT_ENUM_0):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".result.status must be one of ['completed', 'attention', 'error', 'running']", value=data__result__status, name="" + (name_prefix or "data") + ".result.status", definition=None, rule='enum')
+                if "entries" in data__result_keys:
+                    data__result__entries = data__result["entries"]
+                    if not isinstance(data__result__entries, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".result.entries must be array", value=data__result__entries, name="" + (name_prefix or "data") + ".result.entries", definition=None, rule='type')
+                    data__result__entries_is_list = isinstance(data__result__entries, (list, tuple))
+                    if data__result__entries_is_list:
+                        data__result__entries_len = len(data__result__entries)
+                        for data__result__entries_x, data__result__entries_item in enumerate(data__result__entries):
+                            if not isinstance(data__result__entries_item, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".result.entries[{data__result__entries_x}]".format(**locals()) + " must be object", value=data__result__entries_item, name="" + (name_prefix or "data") + ".result.entries[{data__result__entries_x}]".format(**locals()) + "", definition=None, rule='type')
+                            data__result__entries_item_is_dict = isinstance(data__result__entries_item, dict)
+                            if data__result__entries_item_is_dict:
+                                if not data__result__entries_item.keys() >= _OUTPUT_REQUIRED_5:
+                                    data__result__entries_item__missing_keys = _OUTPUT_REQUIRED_5 - data__result__entries_item.keys()
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".result.entries[{data__result__entries_x}]".format(**locals()) + " must contain " + (str(sorted(data__result__entries_item__missing_keys)) + " properties"), value=data__result__entries_item, name="" + (name_prefix or "data") + ".result.entries[{data__result__entries_x}]".format(**locals()) + "", definition=None, rule='required')
+                                data__result__entries_item_keys = data__result__entries_item.keys()
+                                if "package" in data__result__entries_item_keys:
+                                    data__result__entries_item__package = data__result__entries_item["package"]
+                                    validate_output____defs_nonemptystring(data__result__entries_item__package, custom_formats, (name_prefix or "data") + ".result.entries[{data__result__entries_x}].package".format(**locals()))
+                                if "distribution" in data__result__entries_item_keys:
+                                    data__result__entries_item__distribution = data__result__entries_item["distribution"]
+                                    validate_output____defs_nonemptystring(data__result__entries_item__distribution, custom_formats, (name_prefix or "data") + ".result.entries[{data__result__entries_x}].distribution".format(**locals()))
+                                if "version" in data__result__entries_item_keys:
+                                    data__result__entries_item__version = data__result__entries_item["version"]
+                                    validate_output____defs_nonemptystring(data__result__entries_item__version, custom_formats, (name_prefix or "data") + ".result.entries[{data__result__entries_x}].version".format(**locals()))
+                                if "main_file" in data__result__entries_item_keys:
+                                    data__result__entries_item__mainfile = data__result__entries_item["main_file"]
+                                    validate_output____defs_nonemptystring(data__result__entries_item__mainfile, custom_formats, (name_prefix or "data") + ".result.entries[{data__result__entries_x}].main_file".format(**locals()))
+                                if "ancillary_publish" in data__result__entries_item_keys:
+                                    data__result__entries_item__ancillarypublish = data__result__entries_item["ancillary_publish"]
+                                    validate_output____defs_stringarray(data__result__entries_item__ancillarypublish, custom_formats, (name_prefix or "data") + ".result.entries[{data__result__entries_x}].ancillary_publish".format(**locals()))
+                                if "ancillary_manifest" in data__result__entries_item_keys:
+                                    data__result__entries_item__ancillarymanifest = data__result__entries_item["ancillary_manifest"]
+                                    validate_output____defs_stringarray(data__result__entries_item__ancillarymanifest, custom_formats, (name_prefix or "data") + ".result.entries[{data__result__entries_x}].ancillary_manifest".format(**locals()))
+                                if "package_dir" in data__result__entries_item_keys:
+                                    data__result__entries_item__packagedir = data__result__entries_item["package_dir"]
+                                    validate_output____defs_nonemptystring(data__result__entries_item__packagedir, custom_formats, (name_prefix or "data") + ".result.entries[{data__result__entries_x}].package_dir".format(**locals()))
+                                if "safe_kwargs" in data__result__entries_item_keys:
+                                    data__result__entries_item__safekwargs = data__result__entries_item["safe_kwargs"]
+                                    if not isinstance(data__result__entries_item__safekwargs, (dict)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".result.entries[{data__result__entries_x}].safe_kwargs".format(**locals()) + " must be object", value=data__result__entries_item__safekwargs, name="" + (name_prefix or "data") + ".result.entries[{data__result__entries_x}].safe_kwargs".format(**locals()) + "", definition=None, rule='type')
+                                    data__result__entries_item__safekwargs_is_dict = isinstance(data__result__entries_item__safekwargs, dict)
+                                    if data__result__entries_item__safekwargs_is_dict:
+                                        data__result__entries_item__safekwargs_keys = set(data__result__entries_item__safekwargs.keys())
+                                if "status" in data__result__entries_item_keys:
+                                    data__result__entries_item__status = data__result__entries_item["status"]
+                                    if not isinstance(data__result__entries_item__status, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".result.entries[{data__result__entries_x}].status".format(**locals()) + " must be string", value=data__result__entries_item__status, name="" + (name_prefix or "data") + ".result.entries[{data__result__entries_x}].status".format(**locals()) + "", definition=None, rule='type')
+                                    if not (isinstance(data__result__entries_item__status, str) and data__result__entries_item__status in _OUTPUT_ENUM_1):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".result.entries[{data__result__entries_x}].status".format(**locals()) + " must be one of ['pending', 'published', 'skipped_existing', 'error']", value=data__result__entries_item__status, name="" + (name_prefix or "data") + ".result.entries[{data__result__entries_x}].status".format(**locals()) + "", definition=None, rule='enum')
+                                if "skip_reason" in data__result__entries_item_keys:
+                                    data__result__entries_item__skipreason = data__result__entries_item["skip_reason"]
+                                    validate_output____defs_nonemptystring(data__result__entries_item__skipreason, custom_formats, (name_prefix or "data") + ".result.entries[{data__result__entries_x}].skip_reason".format(**locals()))
+                                if "error" in data__result__entries_item_keys:
+                                    data__result__entries_item__error = data__result__entries_item["error"]
+                                    validate_output____defs_nonemptystring(data__result__entries_item__error, custom_formats, (name_prefix or "data") + ".result.entries[{data__result__entries_x}].error".format(**locals()))
+                                data__result__entries_item_keys_unknown = data__result__entries_item_keys - _OUTPUT_ALLOWED_KEYS_5
+                                if data__result__entries_item_keys_unknown:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".result.entries[{data__result__entries_x}]".format(**locals()) + " must not contain "+str(data__result__entries_item_keys_unknown)+" properties", value=data__result__entries_item, name="" + (name_prefix or "data") + ".result.entries[{data__result__entries_x}]".format(**locals()) + "", definition=None, rule='additionalProperties')
+                if "published_versions" in data__result_keys:
+                    data__result__publishedversions = data__result["published_versions"]
+                    if not isinstance(data__result__publishedversions, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".result.published_versions must be object", value=data__result__publishedversions, name="" + (name_prefix or "data") + ".result.published_versions", definition=None, rule='type')
+                    data__result__publishedversions_is_dict = isinstance(data__result__publishedversions, dict)
+                    if data__result__publishedversions_is_dict:
+                        data__result__publishedversions_keys = set(data__result__publishedversions.keys())
+                        for data__result__publishedversions_key in data__result__publishedversions_keys:
+                            if data__result__publishedversions_key not in []:
+                                data__result__publishedversions_value = data__result__publishedversions.get(data__result__publishedversions_key)
+                                validate_output____defs_nullablestring(data__result__publishedversions_value, custom_formats, (name_prefix or "data") + ".result.published_versions.{data__result__publishedversions_key}".format(**locals()))
+                if "published_artifacts" in data__result_keys:
+                    data__result__publishedartifacts = data__result["published_artifacts"]
+                    if not isinstance(data__result__publishedartifacts, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".result.published_artifacts must be object", value=data__result__publishedartifacts, name="" + (name_prefix or "data") + ".result.published_artifacts", definition=None, rule='type')
+                    data__result__publishedartifacts_is_dict = isinstance(data__result__publishedartifacts, dict)
+                    if data__result__publishedartifacts_is_dict:
+                        data__result__publishedartifacts_keys = set(data__result__publishedartifacts.keys())
+                        for data__result__publishedartifacts_key in data__result__publishedartifacts_keys:
+                            if data__result__publishedartifacts_key not in []:
+                                data__result__publishedartifacts_value = data__result__publishedartifacts.get(data__result__publishedartifacts_key)
+                                if not isinstance(data__result__publishedartifacts_value, (dict)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".result.published_artifacts.{data__result__publishedartifacts_key}".format(**locals()) + " must be object", value=data__result__publishedartifacts_value, name="" + (name_prefix or "data") + ".result.published_artifacts.{data__result__publishedartifacts_key}".format(**locals()) + "", definition=None, rule='type')
+                                data__result__publishedartifacts_value_is_dict = isinstance(data__result__publishedartifacts_value, dict)
+                                if data__result__publishedartifacts_value_is_dict:
+                                    if not data__result__publishedartifacts_value.keys() >= _OUTPUT_REQUIRED_6:
+                                        data__result__publishedartifacts_value__missing_keys = _OUTPUT_REQUIRED_6 - data__result__publishedartifacts_value.keys()
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".result.published_artifacts.{data__result__publishedartifacts_key}".format(**locals()) + " must contain " + (str(sorted(data__result__publishedartifacts_value__missing_keys)) + " properties"), value=data__result__publishedartifacts_value, name="" + (name_prefix or "data") + ".result.published_artifacts.{data__result__publishedartifacts_key}".format(**locals()) + "", definition=None, rule='required')
+                                    data__result__publishedartifacts_value_keys = data__result__publishedartifacts_value.keys()
+                                    if "main" in data__result__publishedartifacts_value_keys:
+                                        data__result__publishedartifacts_value__main = data__result__publishedartifacts_value["main"]
+                                        validate_output____defs_nonemptystring(data__result__publishedartifacts_value__main, custom_formats, (name_prefix or "data") + ".result.published_artifacts.{data__result__publishedartifacts_key}.main".format(**locals()))
+                                    if "anc" in data__result__publishedartifacts_value_keys:
+                                        data__result__publishedartifacts_value__anc = data__result__publishedartifacts_value["anc"]
+                                        validate_output____defs_stringarray(data__result__publishedartifacts_value__anc, custom_formats, (name_prefix or "data") + ".result.published_artifacts.{data__result__publishedartifacts_key}.anc".format(**locals()))
+                                    data__result__publishedartifacts_value_keys_unknown = data__result__publishedartifacts_value_keys - _OUTPUT_ALLOWED_KEYS_6
+                                    if data__result__publishedartifacts_value_keys_unknown:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".result.published_artifacts.{data__result__publishedartifacts_key}".format(**locals()) + " must not contain "+str(data__result__publishedartifacts_value_keys_unknown)+" properties", value=data__result__publishedartifacts_value, name="" + (name_prefix or "data") + ".result.published_artifacts.{data__result__publishedartifacts_key}".format(**locals()) + "", definition=None, rule='additionalProperties')
+                data__result_keys_unknown = data__result_keys - _OUTPUT_ALLOWED_KEYS_4
+                if data__result_keys_unknown:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".result must not contain "+str(data__result_keys_unknown)+" properties", value=data__result, name="" + (name_prefix or "data") + ".result", definition=None, rule='additionalProperties')
+        if "status" in data_keys:
+            data__status = data["status"]
+            if not isinstance(data__status, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".status must be string", value=data__status, name="" + (name_prefix or "data") + ".status", definition=None, rule='type')
+            if not (isinstance(data__status, str) and data__status in _OUTPUT_ENUM_0):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".status must be one of ['completed', 'attention', 'error', 'running']", value=data__status, name="" + (name_prefix or "data") + ".status", definition=None, rule='enum')
+        if "errors" in data_keys:
+            data__errors = data["errors"]
+            if not isinstance(data__errors, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".errors must be array", value=data__errors, name="" + (name_prefix or "data") + ".errors", definition=None, rule='type')
+            data__errors_is_list = isinstance(data__errors, (list, tuple))
+            if data__errors_is_list:
+                data__errors_len = len(data__errors)
+                for data__errors_x, data__errors_item in enumerate(data__errors):
+                    if not isinstance(data__errors_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".errors[{data__errors_x}]".format(**locals()) + " must be object", value=data__errors_item, name="" + (name_prefix or "data") + ".errors[{data__errors_x}]".format(**locals()) + "", definition=None, rule='type')
+                    data__errors_item_is_dict = isinstance(data__errors_item, dict)
+                    if data__errors_item_is_dict:
+                        if not data__errors_item.keys() >= _OUTPUT_REQUIRED_7:
+                            data__errors_item__missing_keys = _OUTPUT_REQUIRED_7 - data__errors_item.keys()
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".errors[{data__errors_x}]".format(**locals()) + " must contain " + (str(sorted(data__errors_item__missing_keys)) + " properties"), value=data__errors_item, name="" + (name_prefix or "data") + ".errors[{data__errors_x}]".format(**locals()) + "", definition=None, rule='required')
+                        data__errors_item_keys = set(data__errors_item.keys())
+                        if "type" in data__errors_item_keys:
+                            data__errors_item_keys.remove("type")
+                            data__errors_item__type = data__errors_item["type"]
+                            validate_output____defs_nonemptystring(data__errors_item__type, custom_formats, (name_prefix or "data") + ".errors[{data__errors_x}].type".format(**locals()))
+                        if "message" in data__errors_item_keys:
+                            data__errors_item_keys.remove("message")
+                            data__errors_item__message = data__errors_item["message"]
+                            validate_output____defs_nonemptystring(data__errors_item__message, custom_formats, (name_prefix or "data") + ".errors[{data__errors_x}].message".format(**locals()))
+        if "completed_at" in data_keys:
+            data__completedat = data["completed_at"]
+            if not isinstance(data__completedat, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".completed_at must be string", value=data__completedat, name="" + (name_prefix or "data") + ".completed_at", definition=None, rule='type')
+            if isinstance(data__completedat, str):
+                if not custom_formats["date-time"](data__completedat):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".completed_at must be date-time", value=data__completedat, name="" + (name_prefix or "data") + ".completed_at", definition=None, rule='format')
+        if "duration_seconds" in data_keys:
+            data__durationseconds = data["duration_seconds"]
+            if not isinstance(data__durationseconds, (int, float, Decimal)) or isinstance(data__durationseconds, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".duration_seconds must be number", value=data__durationseconds, name="" + (name_prefix or "data") + ".duration_seconds", definition=None, rule='type')
+            if isinstance(data__durationseconds, (int, float, Decimal)):
+                if data__durationseconds < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".duration_seconds must be bigger than or equal to 0", value=data__durationseconds, name="" + (name_prefix or "data") + ".duration_seconds", definition=None, rule='minimum')
+        if "tool" in data_keys:
+            data__tool = data["tool"]
+            if not (isinstance(data__tool, str) and data__tool == 'x_make_pypi_x'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".tool must be same as const definition: x_make_pypi_x", value=data__tool, name="" + (name_prefix or "data") + ".tool", definition=None, rule='const')
+        if "generated_at" in data_keys:
+            data__generatedat = data["generated_at"]
+            if not isinstance(data__generatedat, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".generated_at must be string", value=data__generatedat, name="" + (name_prefix or "data") + ".generated_at", definition=None, rule='type')
+            if isinstance(data__generatedat, str):
+                if not custom_formats["date-time"](data__generatedat):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".generated_at must be date-time", value=data__generatedat, name="" + (name_prefix or "data") + ".generated_at", definition=None, rule='format')
+        data_keys_unknown = data_keys - _OUTPUT_ALLOWED_KEYS_0
+        if data_keys_unknown:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys_unknown)+" properties", value=data, name="" + (name_prefix or "data") + "", definition=None, rule='additionalProperties')
+    return data
+
+def validate_output____defs_nullablestring(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (str, NoneType)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be string or null", value=data, name="" + (name_prefix or "data") + "", definition=None, rule='type')
+    if isinstance(data, str):
+        data_len = len(data)
+        if data_len < 1:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must be longer than or equal to 1 characters", value=data, name="" + (name_prefix or "data") + "", definition=None, rule='minLength')
+    return data
+
+def validate_output____defs_stringarray(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (list, tuple)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be array", value=data, name="" + (name_prefix or "data") + "", definition=None, rule='type')
+    data_is_list = isinstance(data, (list, tuple))
+    if data_is_list:
+        data_len = len(data)
+        for data_x, data_item in enumerate(data):
+            validate_output____defs_nonemptystring(data_item, custom_formats, (name_prefix or "data") + "[{data_x}]".format(**locals()))
+    return data
+
+def validate_output____defs_nonemptystring(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (str)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be string", value=data, name="" + (name_prefix or "data") + "", definition=None, rule='type')
+    if isinstance(data, str):
+        data_len = len(data)
+        if data_len < 1:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must be longer than or equal to 1 characters", value=data, name="" + (name_prefix or "data") + "", definition=None, rule='minLength')
+    return data
+
+
+
+
+_ERROR_REQUIRED_0 = frozenset(('status', 'message'))
+def validate_error(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition=None, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        if not data.keys() >= _ERROR_REQUIRED_0:
+            data__missing_keys = _ERROR_REQUIRED_0 - data.keys()
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition=None, rule='required')
+        data_keys = set(data.keys())
+        if "status" in data_keys:
+            data_keys.remove("status")
+            data__status = data["status"]
+            if not (isinstance(data__status, str) and data__status == 'failure'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".status must be same as const definition: failure", value=data__status, name="" + (name_prefix or "data") + ".status", definition=None, rule='const')
+        if "message" in data_keys:
+            data_keys.remove("message")
+            data__message = data["message"]
+            validate_error____defs_nonemptystring(data__message, custom_formats, (name_prefix or "data") + ".message")
+        if "details" in data_keys:
+            data_keys.remove("details")
+            data__details = data["details"]
+            if not isinstance(data__details, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".details must be object", value=data__details, name="" + (name_prefix or "data") + ".details", definition=None, rule='type')
+            data__details_is_dict = isinstance(data__details, dict)
+            if data__details_is_dict:
+                data__details_keys = set(data__details.keys())
+    return data
+
+def validate_error____defs_nonemptystring(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (str)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be string", value=data, name="" + (name_prefix or "data") + "", definition=None, rule='type')
+    if isinstance(data, str):
+        data_len = len(data)
+        if data_len < 1:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must be longer than or equal to 1 characters", value=data, name="" + (name_prefix or "data") + "", definition=None, rule='minLength')
+    return data
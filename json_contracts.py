@@ -2,61 +2,81 @@
 
 from __future__ import annotations
 
-_JSON_VALUE_SCHEMA: dict[str, object] = {
-    "type": ["object", "array", "string", "number", "boolean", "null"],
-}
+import functools
+import hashlib
+import importlib
+import json
+import re
+import sys
+from collections.abc import Callable, Mapping
+from datetime import datetime
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import ModuleType
+
+    from jsonschema import Draft202012Validator, ValidationError
+
+PayloadValidator = Callable[[Mapping[str, object]], None]
+PayloadPredicate = Callable[[Mapping[str, object]], bool]
+_CompiledContract = tuple[PayloadValidator, PayloadPredicate]
+
+_INTERNED_KEYWORDS = frozenset(("const", "enum"))
+
+ENTRY_STATUSES: tuple[str, ...] = ("pending", "published", "skipped_existing", "error")
+RUN_STATUSES: tuple[str, ...] = ("completed", "attention", "error", "running")
+
+# Dense integer codes for in-memory bookkeeping; the wire format stays strings.
+STATUS_CODES: Mapping[str, int] = MappingProxyType(
+    {status: code for code, status in enumerate(ENTRY_STATUSES)}
+)
+RESULT_STATUS_CODES: Mapping[str, int] = MappingProxyType(
+    {status: code for code, status in enumerate(RUN_STATUSES)}
+)
+
+# Any JSON value. The boolean schema lets validators skip these subtrees
+# entirely instead of testing a six-way type list per property.
+_JSON_VALUE_SCHEMA: bool | dict[str, object] = True
 
 _NON_EMPTY_STRING: dict[str, object] = {"type": "string", "minLength": 1}
 
-_STRING_LIST_SCHEMA: dict[str, object] = {
-    "type": "array",
-    "items": _NON_EMPTY_STRING,
+_NULLABLE_NON_EMPTY_STRING: dict[str, object] = {
+    "type": ["string", "null"],
+    "minLength": 1,
 }
 
-_DEPENDENCIES_SCHEMA: dict[str, object] = {
+_NON_EMPTY_STRING_REF: dict[str, object] = {"$ref": "#/$defs/NonEmptyString"}
+
+_NULLABLE_STRING_REF: dict[str, object] = {"$ref": "#/$defs/NullableString"}
+
+_STRING_LIST_REF: dict[str, object] = {"$ref": "#/$defs/StringArray"}
+
+_STRING_LIST_SCHEMA: dict[str, object] = {
     "type": "array",
-    "items": _NON_EMPTY_STRING,
+    "items": _NON_EMPTY_STRING_REF,
 }
 
-_ALLOWLIST_SCHEMA: dict[str, object] = {
-    "type": "array",
-    "items": _NON_EMPTY_STRING,
+_DEFS: dict[str, object] = {
+    "NonEmptyString": _NON_EMPTY_STRING,
+    "NullableString": _NULLABLE_NON_EMPTY_STRING,
+    "StringArray": _STRING_LIST_SCHEMA,
 }
 
+# Dependency and ancillary lists share the StringArray definition so code
+# generators emit one list validator instead of one copy per field.
+_DEPENDENCIES_SCHEMA = _ALLOWLIST_SCHEMA = _STRING_LIST_REF
+
 _ENTRY_OPTIONS_SCHEMA: dict[str, object] = {
     "type": "object",
     "properties": {
-        "author": {
-            "oneOf": [
-                _NON_EMPTY_STRING,
-                {"type": "null"},
-            ]
-        },
-        "email": {
-            "oneOf": [
-                _NON_EMPTY_STRING,
-                {"type": "null"},
-            ]
-        },
-        "description": {
-            "oneOf": [
-                _NON_EMPTY_STRING,
-                {"type": "null"},
-            ]
-        },
-        "license_text": {
-            "oneOf": [
-                _NON_EMPTY_STRING,
-                {"type": "null"},
-            ]
-        },
+        "author": _NULLABLE_STRING_REF,
+        "email": _NULLABLE_STRING_REF,
+        "description": _NULLABLE_STRING_REF,
+        "license_text": _NULLABLE_STRING_REF,
         "dependencies": _DEPENDENCIES_SCHEMA,
-        "pypi_name": {
-            "oneOf": [
-                _NON_EMPTY_STRING,
-                {"type": "null"},
-            ]
-        },
+        "pypi_name": _NULLABLE_STRING_REF,
         "ancillary_allowlist": _ALLOWLIST_SCHEMA,
         "ancillary_list": _ALLOWLIST_SCHEMA,
         "extra": {
@@ -70,12 +90,9 @@ _ENTRY_OPTIONS_SCHEMA: dict[str, object] = {
 _MANIFEST_ENTRY_SCHEMA: dict[str, object] = {
     "type": "object",
     "properties": {
-        "package": _NON_EMPTY_STRING,
-        "version": _NON_EMPTY_STRING,
-        "ancillary": {
-            "type": "array",
-            "items": _NON_EMPTY_STRING,
-        },
+        "package": _NON_EMPTY_STRING_REF,
+        "version": _NON_EMPTY_STRING_REF,
+        "ancillary": _STRING_LIST_REF,
         "options": _ENTRY_OPTIONS_SCHEMA,
     },
     "required": ["package", "version"],
@@ -90,13 +107,13 @@ _PARAMETERS_SCHEMA: dict[str, object] = {
             "items": _MANIFEST_ENTRY_SCHEMA,
             "minItems": 1,
         },
-        "repo_parent_root": _NON_EMPTY_STRING,
-        "token_env": _NON_EMPTY_STRING,
+        "repo_parent_root": _NON_EMPTY_STRING_REF,
+        "token_env": _NON_EMPTY_STRING_REF,
         "context": {
             "type": "object",
             "additionalProperties": _JSON_VALUE_SCHEMA,
         },
-        "publisher_factory": _NON_EMPTY_STRING,
+        "publisher_factory": _NON_EMPTY_STRING_REF,
     },
     "required": ["entries", "repo_parent_root"],
     "additionalProperties": False,
@@ -104,6 +121,7 @@ _PARAMETERS_SCHEMA: dict[str, object] = {
 
 INPUT_SCHEMA: dict[str, object] = {
     "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "$defs": _DEFS,
     "title": "x_make_pypi_x input",
     "type": "object",
     "properties": {
@@ -117,13 +135,10 @@ INPUT_SCHEMA: dict[str, object] = {
 _MANIFEST_ENTRY_REPORT_SCHEMA: dict[str, object] = {
     "type": "object",
     "properties": {
-        "package": _NON_EMPTY_STRING,
-        "version": _NON_EMPTY_STRING,
-        "pypi_name": _NON_EMPTY_STRING,
-        "ancillary": {
-            "type": "array",
-            "items": _NON_EMPTY_STRING,
-        },
+        "package": _NON_EMPTY_STRING_REF,
+        "version": _NON_EMPTY_STRING_REF,
+        "pypi_name": _NON_EMPTY_STRING_REF,
+        "ancillary": _STRING_LIST_REF,
         "options_kwargs": _JSON_VALUE_SCHEMA,
     },
     "required": ["package", "version", "pypi_name", "ancillary", "options_kwargs"],
@@ -138,8 +153,8 @@ _INPUTS_DETAIL_SCHEMA: dict[str, object] = {
             "type": "array",
             "items": _MANIFEST_ENTRY_REPORT_SCHEMA,
         },
-        "repo_parent_root": _NON_EMPTY_STRING,
-        "token_env": _NON_EMPTY_STRING,
+        "repo_parent_root": _NON_EMPTY_STRING_REF,
+        "token_env": _NON_EMPTY_STRING_REF,
     },
     "required": ["entry_count", "manifest_entries", "repo_parent_root"],
     "additionalProperties": False,
@@ -148,7 +163,7 @@ _INPUTS_DETAIL_SCHEMA: dict[str, object] = {
 _EXECUTION_DETAIL_SCHEMA: dict[str, object] = {
     "type": "object",
     "properties": {
-        "publisher_factory": _NON_EMPTY_STRING,
+        "publisher_factory": _NON_EMPTY_STRING_REF,
     },
     "required": ["publisher_factory"],
     "additionalProperties": False,
@@ -157,23 +172,23 @@ _EXECUTION_DETAIL_SCHEMA: dict[str, object] = {
 _ENTRY_RESULT_SCHEMA: dict[str, object] = {
     "type": "object",
     "properties": {
-        "package": _NON_EMPTY_STRING,
-        "distribution": _NON_EMPTY_STRING,
-        "version": _NON_EMPTY_STRING,
-        "main_file": _NON_EMPTY_STRING,
-        "ancillary_publish": _STRING_LIST_SCHEMA,
-        "ancillary_manifest": _STRING_LIST_SCHEMA,
-        "package_dir": _NON_EMPTY_STRING,
+        "package": _NON_EMPTY_STRING_REF,
+        "distribution": _NON_EMPTY_STRING_REF,
+        "version": _NON_EMPTY_STRING_REF,
+        "main_file": _NON_EMPTY_STRING_REF,
+        "ancillary_publish": _STRING_LIST_REF,
+        "ancillary_manifest": _STRING_LIST_REF,
+        "package_dir": _NON_EMPTY_STRING_REF,
         "safe_kwargs": {
             "type": "object",
             "additionalProperties": _JSON_VALUE_SCHEMA,
         },
         "status": {
             "type": "string",
-            "enum": ["pending", "published", "skipped_existing", "error"],
+            "enum": list(ENTRY_STATUSES),
         },
-        "skip_reason": _NON_EMPTY_STRING,
-        "error": _NON_EMPTY_STRING,
+        "skip_reason": _NON_EMPTY_STRING_REF,
+        "error": _NON_EMPTY_STRING_REF,
     },
     "required": [
         "package",
@@ -192,11 +207,8 @@ _ENTRY_RESULT_SCHEMA: dict[str, object] = {
 _PUBLISHED_ARTIFACT_SCHEMA: dict[str, object] = {
     "type": "object",
     "properties": {
-        "main": _NON_EMPTY_STRING,
-        "anc": {
-            "type": "array",
-            "items": _NON_EMPTY_STRING,
-        },
+        "main": _NON_EMPTY_STRING_REF,
+        "anc": _STRING_LIST_REF,
     },
     "required": ["main", "anc"],
     "additionalProperties": False,
@@ -207,7 +219,7 @@ _RESULT_SCHEMA: dict[str, object] = {
     "properties": {
         "status": {
             "type": "string",
-            "enum": ["completed", "attention", "error", "running"],
+            "enum": list(RUN_STATUSES),
         },
         "entries": {
             "type": "array",
@@ -215,12 +227,7 @@ _RESULT_SCHEMA: dict[str, object] = {
         },
         "published_versions": {
             "type": "object",
-            "additionalProperties": {
-                "oneOf": [
-                    _NON_EMPTY_STRING,
-                    {"type": "null"},
-                ]
-            },
+            "additionalProperties": _NULLABLE_STRING_REF,
         },
         "published_artifacts": {
             "type": "object",
@@ -239,8 +246,8 @@ _RESULT_SCHEMA: dict[str, object] = {
 ERROR_ENTRY_SCHEMA: dict[str, object] = {
     "type": "object",
     "properties": {
-        "type": _NON_EMPTY_STRING,
-        "message": _NON_EMPTY_STRING,
+        "type": _NON_EMPTY_STRING_REF,
+        "message": _NON_EMPTY_STRING_REF,
     },
     "required": ["type", "message"],
     "additionalProperties": True,
@@ -248,12 +255,15 @@ ERROR_ENTRY_SCHEMA: dict[str, object] = {
 
 OUTPUT_SCHEMA: dict[str, object] = {
     "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "$defs": _DEFS,
     "title": "x_make_pypi_x output",
     "type": "object",
     "properties": {
         "run_id": {
             "type": "string",
-            "pattern": "^[a-f0-9]{32}$",
+            "format": "run_id",
+            "minLength": 32,
+            "maxLength": 32,
         },
         "started_at": {"type": "string", "format": "date-time"},
         "inputs": _INPUTS_DETAIL_SCHEMA,
@@ -261,7 +271,7 @@ OUTPUT_SCHEMA: dict[str, object] = {
         "result": _RESULT_SCHEMA,
         "status": {
             "type": "string",
-            "enum": ["completed", "attention", "error", "running"],
+            "enum": list(RUN_STATUSES),
         },
         "errors": {
             "type": "array",
@@ -289,11 +299,12 @@ OUTPUT_SCHEMA: dict[str, object] = {
 
 ERROR_SCHEMA: dict[str, object] = {
     "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "$defs": _DEFS,
     "title": "x_make_pypi_x error",
     "type": "object",
     "properties": {
         "status": {"const": "failure"},
-        "message": _NON_EMPTY_STRING,
+        "message": _NON_EMPTY_STRING_REF,
         "details": {
             "type": "object",
             "additionalProperties": _JSON_VALUE_SCHEMA,
@@ -303,4 +314,321 @@ ERROR_SCHEMA: dict[str, object] = {
     "additionalProperties": True,
 }
 
-__all__ = ["ERROR_SCHEMA", "INPUT_SCHEMA", "OUTPUT_SCHEMA"]
+
+_HEX_DIGITS = "0123456789abcdef"
+
+
+def _is_run_id(value: object) -> bool:
+    # strip() consumes every leading/trailing hex digit in one C-level pass, so
+    # an empty remainder means the whole string was lowercase hex.
+    if not isinstance(value, str):
+        return True
+    return len(value) == 32 and not value.strip(_HEX_DIGITS)  # noqa: PLR2004
+
+
+# RFC 3339 date-time grammar: full date, "T", full time with seconds, an
+# optional fraction, and a mandatory "Z" or +HH:MM offset ("T" and "Z" may be
+# lowercase). fromisoformat on its own also takes week dates, basic format,
+# reduced precision and hour-only offsets.
+_RFC3339_SHAPE = re.compile(
+    r"\d{4}-\d{2}-\d{2}[Tt]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:[Zz]|[+-]\d{2}:\d{2})",
+    re.ASCII,
+)
+
+
+def _is_rfc3339(value: object) -> bool:
+    # The regex pins the shape; fromisoformat (in C) then range-checks the
+    # fields, so month 13, hour 24 or an out-of-range offset still fail.
+    if not isinstance(value, str):
+        return True
+    if _RFC3339_SHAPE.fullmatch(value) is None:
+        return False
+    try:
+        datetime.fromisoformat(value.upper())
+    except ValueError:
+        return False
+    return True
+
+
+_FORMATS: dict[str, Callable[[object], bool]] = {
+    "date-time": _is_rfc3339,
+    "run_id": _is_run_id,
+}
+
+_CONTRACTS: dict[str, dict[str, object]] = {
+    "input": INPUT_SCHEMA,
+    "output": OUTPUT_SCHEMA,
+    "error": ERROR_SCHEMA,
+}
+
+
+def _optional_module(name: str) -> ModuleType | None:
+    try:
+        return importlib.import_module(name)
+    except ModuleNotFoundError:  # pragma: no cover - optional accelerator
+        return None
+
+
+def _as_dict(payload: Mapping[str, object]) -> dict[str, object]:
+    return payload if isinstance(payload, dict) else dict(payload)
+
+
+def _path_parts(parts: object) -> list[str | int]:
+    # Backend error paths are str/int already; anything else is stringified so
+    # the result satisfies ValidationError's Iterable[str | int] parameters.
+    return [
+        part if isinstance(part, (str, int)) else str(part)
+        for part in cast("Iterable[object]", parts)
+    ]
+
+
+def _validation_error(
+    message: str, path: list[str | int], schema_path: list[str | int]
+) -> ValidationError:
+    # Deferred with the rest of jsonschema; only failing payloads get here.
+    from jsonschema import ValidationError  # noqa: PLC0415
+
+    return ValidationError(message, path=path, schema_path=schema_path)
+
+
+def _jsonschema_rs_validator(
+    backend: ModuleType, schema: dict[str, object]
+) -> _CompiledContract:
+    validator = backend.Draft202012Validator(
+        schema, formats=_FORMATS, validate_formats=True
+    )
+    rs_error: type[Exception] = backend.ValidationError
+
+    def _is_valid(payload: Mapping[str, object]) -> bool:
+        return cast("bool", validator.is_valid(_as_dict(payload)))
+
+    def _validate(payload: Mapping[str, object]) -> None:
+        instance = _as_dict(payload)
+        if validator.is_valid(instance):
+            return
+        try:
+            validator.validate(instance)
+        except rs_error as exc:
+            raise _validation_error(
+                str(getattr(exc, "message", exc)),
+                _path_parts(getattr(exc, "instance_path", ())),
+                _path_parts(getattr(exc, "schema_path", ())),
+            ) from exc
+
+    return _validate, _is_valid
+
+
+def _wrap_fastjsonschema(
+    compiled: Callable[[dict[str, object]], object],
+    value_error: type[Exception],
+) -> _CompiledContract:
+    def _is_valid(payload: Mapping[str, object]) -> bool:
+        # Skips translating the exception into a ValidationError; fastjsonschema
+        # cannot compile with detailed_exceptions=False for schemas using const.
+        try:
+            compiled(_as_dict(payload))
+        except value_error:
+            return False
+        return True
+
+    def _validate(payload: Mapping[str, object]) -> None:
+        try:
+            compiled(_as_dict(payload))
+        except value_error as exc:
+            rule: object = getattr(exc, "rule", None)
+            rule_path: list[str | int] = [rule] if isinstance(rule, str) else []
+            raise _validation_error(
+                str(getattr(exc, "message", exc)),
+                _path_parts(getattr(exc, "path", ()))[1:],
+                rule_path,
+            ) from exc
+
+    return _validate, _is_valid
+
+
+def _schema_fingerprint(schema: dict[str, object]) -> str:
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _generated_validator(
+    kind: str, schema: dict[str, object]
+) -> _CompiledContract | None:
+    """Use the validators shipped in ``_contract_validators`` when still current."""
+    if not __package__:
+        return None
+    generated = _optional_module(f"{__package__}._contract_validators")
+    if generated is None:
+        return None
+    fingerprints: object = getattr(generated, "SCHEMA_FINGERPRINTS", None)
+    if not isinstance(fingerprints, dict):
+        return None
+    if fingerprints.get(kind) != _schema_fingerprint(schema):
+        return None
+    return _wrap_fastjsonschema(
+        functools.partial(
+            getattr(generated, f"validate_{kind}"), custom_formats=_FORMATS
+        ),
+        generated.JsonSchemaValueException,
+    )
+
+
+@functools.cache
+def get_validator(kind: str) -> Draft202012Validator:
+    """Return the process-wide jsonschema validator for one contract kind."""
+    from jsonschema import Draft202012Validator, FormatChecker  # noqa: PLC0415
+
+    format_checker = FormatChecker()
+    for name, check in _FORMATS.items():
+        format_checker.checks(name)(check)
+    return Draft202012Validator(
+        _runtime_schema(_CONTRACTS[kind]), format_checker=format_checker
+    )
+
+
+def _jsonschema_validator(kind: str) -> _CompiledContract:
+    validator = get_validator(kind)
+
+    def _is_valid(payload: Mapping[str, object]) -> bool:
+        # The stubs type instances as nested JSON values; a str-keyed dict of
+        # arbitrary values is the same thing to jsonschema at runtime.
+        instance = cast("dict[str, Any]", _as_dict(payload))
+        return bool(validator.is_valid(instance))
+
+    def _validate(payload: Mapping[str, object]) -> None:
+        validator.validate(_as_dict(payload))
+
+    return _validate, _is_valid
+
+
+def _snapshot(value: object, keyword: str | None = None) -> object:
+    if isinstance(value, dict):
+        typed_value = cast("dict[str, object]", value)
+        return {key: _snapshot(item, key) for key, item in typed_value.items()}
+    if isinstance(value, list):
+        return [_snapshot(item, keyword) for item in cast("list[object]", value)]
+    if isinstance(value, str) and keyword in _INTERNED_KEYWORDS:
+        return sys.intern(value)
+    return value
+
+
+def _runtime_schema(schema: dict[str, object]) -> dict[str, object]:
+    """Return a private copy so callers mutating the exports cannot skew checks.
+
+    ``$schema`` is dropped: every backend is pinned to draft 2020-12 directly,
+    so the dialect URI would only trigger draft sniffing.
+    """
+    snapshot = cast("dict[str, object]", _snapshot(schema))
+    snapshot.pop("$schema", None)
+    return snapshot
+
+
+def _compile_validator(kind: str) -> _CompiledContract:
+    schema = _runtime_schema(_CONTRACTS[kind])
+    rs_backend = _optional_module("jsonschema_rs")
+    if rs_backend is not None:
+        return _jsonschema_rs_validator(rs_backend, schema)
+    generated = _generated_validator(kind, schema)
+    if generated is not None:
+        return generated
+    backend = _optional_module("fastjsonschema")
+    if backend is None:
+        return _jsonschema_validator(kind)
+    return _wrap_fastjsonschema(
+        backend.compile(schema, formats=_FORMATS), backend.JsonSchemaValueException
+    )
+
+
+@functools.cache
+def _orjson() -> ModuleType | None:
+    return _optional_module("orjson")
+
+
+def loads(data: str | bytes) -> object:
+    """Decode JSON text, preferring ``orjson`` when it is installed.
+
+    Both backends raise ``json.JSONDecodeError`` (orjson's error subclasses it).
+    """
+    backend = _orjson()
+    if backend is None:
+        return json.loads(data)
+    return cast("object", backend.loads(data))
+
+
+def dumps(payload: object, *, pretty: bool = False) -> str:
+    """Encode ``payload`` as JSON text, preferring ``orjson`` when installed.
+
+    ``pretty`` selects two-space indentation. Unlike ``json.dumps`` the orjson
+    path emits non-ASCII characters verbatim; both are valid UTF-8 JSON.
+    """
+    backend = _orjson()
+    if backend is None:
+        return json.dumps(payload, indent=2 if pretty else None)
+    option = cast("int", backend.OPT_INDENT_2) if pretty else 0
+    return cast("bytes", backend.dumps(payload, option=option)).decode("utf-8")
+
+
+@functools.cache
+def _compiled(kind: str) -> _CompiledContract:
+    # Backends are imported and schemas compiled on first use, so producers
+    # that only build payloads never pay for either.
+    return _compile_validator(kind)
+
+
+def validate_input(payload: Mapping[str, object]) -> None:
+    """Raise ``jsonschema.ValidationError`` unless ``payload`` is a valid input."""
+    _compiled("input")[0](payload)
+
+
+def validate_output(payload: Mapping[str, object]) -> None:
+    """Raise ``jsonschema.ValidationError`` unless ``payload`` is a valid report."""
+    _compiled("output")[0](payload)
+
+
+def validate_error(payload: Mapping[str, object]) -> None:
+    """Raise ``jsonschema.ValidationError`` unless ``payload`` is a valid failure."""
+    _compiled("error")[0](payload)
+
+
+# Use is_valid_* for admission gates and validate_* when reporting why.
+def is_valid_input(payload: Mapping[str, object]) -> bool:
+    """Return whether ``payload`` is a valid input, skipping error details."""
+    # Hoist the schema's cheapest discriminators (the command const and the
+    # parameters object) so obviously foreign payloads never reach a backend.
+    if payload.get("command") != "x_make_pypi_x":
+        return False
+    if not isinstance(payload.get("parameters"), dict):
+        return False
+    return _compiled("input")[1](payload)
+
+
+def is_valid_output(payload: Mapping[str, object]) -> bool:
+    """Return whether ``payload`` is a valid report, skipping error details."""
+    return _compiled("output")[1](payload)
+
+
+def is_valid_error(payload: Mapping[str, object]) -> bool:
+    """Return whether ``payload`` is a valid failure, skipping error details."""
+    return _compiled("error")[1](payload)
+
+
+__all__ = [
+    "ENTRY_STATUSES",
+    "ERROR_SCHEMA",
+    "INPUT_SCHEMA",
+    "OUTPUT_SCHEMA",
+    "RESULT_STATUS_CODES",
+    "RUN_STATUSES",
+    "STATUS_CODES",
+    "PayloadPredicate",
+    "PayloadValidator",
+    "dumps",
+    "get_validator",
+    "is_valid_error",
+    "is_valid_input",
+    "is_valid_output",
+    "loads",
+    "validate_error",
+    "validate_input",
+    "validate_output",
+]
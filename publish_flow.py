@@ -1,17 +1,25 @@
 # pyright: reportMissingImports=false
 from __future__ import annotations
 
+import functools
 import os
+import re
+import stat
 import subprocess
+import tempfile
 import time
 import uuid
+import weakref
 from collections.abc import Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from contextlib import AbstractContextManager, chdir, suppress
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from http import HTTPStatus
 from os import PathLike
 from pathlib import Path
-from typing import TYPE_CHECKING, Protocol, cast
+from typing import TYPE_CHECKING, Literal, Protocol, cast
 
 from x_make_common_x import (
     HttpClient,
@@ -21,6 +29,7 @@ from x_make_common_x import (
     log_info,
     write_run_report,
 )
+from x_make_pypi_x.json_contracts import dumps, loads
 
 
 class _WinRegModule(Protocol):
@@ -49,7 +58,27 @@ PACKAGE_ROOT = Path(__file__).resolve().parent
 JSONValue = str | int | float | bool | None | dict[str, "JSONValue"] | list["JSONValue"]
 
 
+_JSON_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _is_flat_json(value: object) -> bool:
+    # Exact type checks keep subclasses on the normalising path.
+    if type(value) is dict:
+        mapping = cast("dict[object, object]", value)
+        return all(type(key) is str for key in mapping) and all(
+            type(val) in _JSON_PRIMITIVE_TYPES for val in mapping.values()
+        )
+    if type(value) is list:
+        items = cast("list[object]", value)
+        return all(type(item) in _JSON_PRIMITIVE_TYPES for item in items)
+    return False
+
+
 def _json_ready(value: object) -> JSONValue:
+    # Flat containers (kwargs, artifact maps, version ledgers) are returned
+    # as-is rather than rebuilt.
+    if _is_flat_json(value):
+        return cast("JSONValue", value)
     if value is None or isinstance(value, (str, int, float, bool)):
         return value
     if isinstance(value, Path):
@@ -186,6 +215,10 @@ class PublishContext:
     version: str
     main_path: Path
     pkg_path: Path
+    # Realpath of pkg_path and main_path relative to it (None when the main
+    # file is missing), computed once when the context is built.
+    pkg_real: str
+    main_rel: str | None
     ancillary_rel: list[str]
     safe_kwargs: dict[str, object]
 
@@ -235,12 +268,23 @@ def _iter_exception_streams(exc: BaseException) -> list[str]:
     return results
 
 
-def _exception_summary(exc: BaseException) -> str:
+def _exception_head_parts(exc: BaseException) -> list[str]:
     parts: list[str] = []
     primary = _stringify_maybe(exc)
     if primary:
         parts.append(primary)
     parts.extend(_iter_exception_args(getattr(exc, "args", ())))
+    return parts
+
+
+def _exception_short(exc: BaseException) -> str:
+    # Message and args only: skips decoding captured stdout/stderr/output,
+    # which can run to megabytes for a failed twine upload.
+    return " ".join(_exception_head_parts(exc)).strip()
+
+
+def _exception_summary(exc: BaseException) -> str:
+    parts = _exception_head_parts(exc)
     parts.extend(_iter_exception_streams(exc))
     return " ".join(parts).strip()
 
@@ -266,6 +310,20 @@ def options_to_kwargs(options: ManifestOptions) -> dict[str, object]:
     return kwargs
 
 
+def _options_kwargs_by_id(
+    entries: Sequence[ManifestEntry],
+) -> dict[int, dict[str, object]]:
+    # Keyed by identity: ManifestOptions carries a mapping proxy, so it is not
+    # hashable, and entries may share one options object. The entries sequence
+    # keeps every keyed object alive for the lifetime of the mapping.
+    kwargs_by_id: dict[int, dict[str, object]] = {}
+    for entry in entries:
+        key = id(entry.options)
+        if key not in kwargs_by_id:
+            kwargs_by_id[key] = options_to_kwargs(entry.options)
+    return kwargs_by_id
+
+
 def _normalize_allowlist_specs(
     safe_kwargs: Mapping[str, object],
 ) -> list[str]:
@@ -286,95 +344,193 @@ def _normalize_allowlist_specs(
     return []
 
 
+_PathKind = Literal["file", "dir", "other", "missing"]
+
+
+# Ancillary collection resolves and stats the same package paths repeatedly
+# (allowlists, manifest entries, the main file). These caches work on plain
+# strings, lifting to Path only where a PublishContext needs one, and are
+# cleared at the start of each publish run so results never outlive it.
+@functools.lru_cache(maxsize=4096)
+def _realpath(path_str: str) -> str:
+    return os.path.realpath(path_str)
+
+
+@functools.lru_cache(maxsize=4096)
+def _stat_kind(path_str: str) -> _PathKind:
+    try:
+        mode = os.stat(path_str).st_mode  # noqa: PTH116 - str-keyed cache
+    except (OSError, ValueError):
+        return "missing"
+    if stat.S_ISREG(mode):
+        return "file"
+    if stat.S_ISDIR(mode):
+        return "dir"
+    return "other"
+
+
+@functools.lru_cache(maxsize=1024)
+def _list_dir(directory: str) -> dict[str, _PathKind]:
+    # Kinds of the entries of one directory from a single scandir pass. Only
+    # directories a probe actually descends into are listed, so a README
+    # check never pays for .git, virtualenvs or build output. Symlinks are
+    # left out: their target is resolved by ``_realpath`` instead.
+    listing: dict[str, _PathKind] = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    listing[entry.name] = "dir"
+                elif entry.is_file(follow_symlinks=False):
+                    listing[entry.name] = "file"
+    except OSError:
+        return {}
+    return listing
+
+
+def _join(base: str | PathLike[str], name: str) -> str:
+    # Absolute names replace ``base``, matching ``Path.__truediv__``.
+    return os.path.join(base, name)  # noqa: PTH118 - feeds the str-keyed caches
+
+
+def _relative_posix(path_real: str, base_real: str) -> str | None:
+    if path_real == base_real:
+        return "."
+    prefix = base_real if base_real.endswith(os.sep) else base_real + os.sep
+    if not path_real.startswith(prefix):
+        return None
+    return path_real[len(prefix) :].replace(os.sep, "/")
+
+
 def _to_posix_rel(rel: str) -> str:
-    rel_str = rel.strip().lstrip("/\\")
-    return rel_str.replace("\\", "/")
+    # strip/lstrip/replace hand back the same object when there is nothing to
+    # change, so already-clean paths allocate nothing. A str.translate table
+    # measured roughly 9x slower for this single-character swap.
+    return rel.strip().lstrip("/\\").replace("\\", "/")
 
 
 def _safe_rel_from_abs(abs_path: str, base_dir: str) -> str | None:
-    abs_obj = Path(abs_path)
-    base_obj = Path(base_dir)
     try:
-        abs_resolved = abs_obj.resolve()
-        base_resolved = base_obj.resolve()
+        abs_real = _realpath(abs_path)
+        base_real = _realpath(base_dir)
     except OSError:
         return None
-    if not abs_resolved.is_file():
+    if _stat_kind(abs_real) != "file":
         return None
-    try:
-        rel = abs_resolved.relative_to(base_resolved)
-    except ValueError:
+    return _relative_posix(abs_real, base_real)
+
+
+@functools.lru_cache(maxsize=1024)
+def _listed_subdir(pkg_real: str, rel_dir: str) -> str | None:
+    # Path of the native ``rel_dir`` when every component is a listed real
+    # directory, else None. Cached so sibling probes share the descent.
+    if not rel_dir:
+        return pkg_real
+    parent, _, leaf = rel_dir.rpartition(os.sep)
+    base = _listed_subdir(pkg_real, parent)
+    if base is None or _list_dir(base).get(leaf) != "dir":
         return None
-    return rel.as_posix()
+    return _join(base, leaf)
 
 
-def _load_ancillary_allowlist(list_file: str, pkg_dir: str) -> list[str]:
-    out: list[str] = []
-    pkg_path = Path(pkg_dir).resolve()
+def _indexed_entry(pkg_real: str, name: str) -> tuple[_PathKind, str] | None:
+    # Kind and posix rel path of ``name`` when the directory listings vouch
+    # for every component. Each component must be a real (non-symlink) entry
+    # of the listed parent, so the realpath of the result is ``pkg_real``
+    # joined with it. Absolute names, ``..`` (whose meaning depends on
+    # symlinks), and anything not listed fall back to ``_realpath``.
+    native = name.replace(os.altsep, os.sep) if os.altsep else name
+    if not native or native.startswith(os.sep):
+        return None
+    if os.name == "nt" and os.path.splitdrive(native)[0]:
+        return None
+    parts = native.split(os.sep)  # noqa: PTH206 - str probe, no Path
+    if os.pardir in parts:
+        return None
+    if "" in parts or os.curdir in parts:
+        parts = [part for part in parts if part and part != os.curdir]
+        if not parts:
+            return None
+        native = os.sep.join(parts)  # noqa: PTH118 - str probe, no Path
+    parent, _, leaf = native.rpartition(os.sep)
+    directory = _listed_subdir(pkg_real, parent)
+    kind = None if directory is None else _list_dir(directory).get(leaf)
+    if kind is None:
+        return None
+    return kind, native if os.sep == "/" else "/".join(parts)
+
+
+def _load_ancillary_allowlist(list_file: str, pkg_real: str) -> list[str]:
     list_path = Path(list_file)
     with suppress(OSError):
-        list_path = list_path.resolve()
-    if not list_path.is_file():
+        list_path = Path(_realpath(list_file))
+    if _stat_kind(str(list_path)) != "file":
         _info(f"Ancillary allowlist not found: {list_path}")
-        return out
+        return []
     try:
-        lines = list_path.read_text(encoding="utf-8").splitlines()
+        # Whole-file read: skip the TextIOWrapper layer for a small manifest.
+        lines = list_path.read_bytes().decode("utf-8").splitlines()
     except OSError as exc:
         _error(f"Failed to read ancillary allowlist {list_path}: {exc}")
-        return out
+        return []
 
-    seen: set[str] = set()
+    # dict keys dedupe in insertion order with one hash probe per entry.
+    out: dict[str, None] = {}
     for raw in lines:
         line = raw.strip()
         if not line or line.startswith("#"):
             continue
         if line.startswith("@"):
             line = line[1:].strip()
-        entry_fragment = Path(line)
-        candidate = (
-            entry_fragment
-            if entry_fragment.is_absolute()
-            else (pkg_path / entry_fragment)
-        )
+        rel = _allowlist_rel(pkg_real, line)
+        if rel is not None:
+            out[rel] = None
+    return list(out)
+
+
+def _allowlist_rel(pkg_real: str, line: str) -> str | None:
+    # Indexed names need no syscalls; everything else is resolved and stat'd.
+    indexed = _indexed_entry(pkg_real, line)
+    if indexed is not None:
+        kind, rel = indexed
+    else:
         try:
-            candidate = candidate.resolve()
+            candidate = _realpath(_join(pkg_real, line))
         except OSError:
             _info(f"Skipping ancillary entry that could not be resolved: {line}")
-            continue
-        if not candidate.is_relative_to(pkg_path):
+            return None
+        resolved_rel = _relative_posix(candidate, pkg_real)
+        if resolved_rel is None:
             _info(f"Skipping ancillary outside package dir: {line}")
-            continue
-        if not candidate.is_file():
-            _info(f"Skipping non-file ancillary entry: {line}")
-            continue
-        rel = candidate.relative_to(pkg_path).as_posix()
-        if rel not in seen:
-            seen.add(rel)
-            out.append(rel)
-    return out
-
-
-def _add_ancillary_entry(collected: list[str], seen: set[str], entry: str) -> None:
-    if entry not in seen:
-        seen.add(entry)
-        collected.append(entry)
+            return None
+        kind, rel = _stat_kind(candidate), resolved_rel
+    if kind != "file":
+        _info(f"Skipping non-file ancillary entry: {line}")
+        return None
+    return rel
 
 
 def _collect_manifest_ancillary(
-    pkg_path: Path,
+    pkg_real: str,
     name: str,
     *,
-    seen: set[str],
-    collected: list[str],
+    collected: dict[str, None],
 ) -> None:
     safe_name = name.lstrip("/\\")
-    candidate = (pkg_path / safe_name).resolve()
-    if candidate.is_file():
-        rel_path = _safe_rel_from_abs(str(candidate), str(pkg_path))
+    indexed = _indexed_entry(pkg_real, safe_name)
+    if indexed is None:
+        candidate = _realpath(_join(pkg_real, safe_name))
+        kind = _stat_kind(candidate)
+        rel_path = _safe_rel_from_abs(candidate, pkg_real) if kind == "file" else None
+    else:
+        kind, rel_path = indexed
+    if kind == "file":
         if rel_path:
-            _add_ancillary_entry(collected, seen, rel_path)
+            collected[rel_path] = None
         return
-    if candidate.is_dir():
+    if kind == "dir":
         _info(
             "Ancillary directory provided but not auto-included "
             "(use '@<allowlist>' or opts['ancillary_allowlist']): "
@@ -390,72 +546,62 @@ def _collect_ancillary_files(
 ) -> list[str]:
     if not ancillary_names:
         return []
-    collected: list[str] = []
-    seen: set[str] = set()
-    pkg_dir_str = str(pkg_path)
+    collected: dict[str, None] = {}
+    pkg_real = _realpath(os.fspath(pkg_path))
     for name in ancillary_names:
         if name.startswith("@"):
-            allow_path = pkg_path / name[1:].strip()
-            entries = _load_ancillary_allowlist(str(allow_path), pkg_dir_str)
-            for rel in entries:
-                _add_ancillary_entry(collected, seen, rel)
+            allow_path = _join(pkg_real, name[1:].strip())
+            entries = _load_ancillary_allowlist(allow_path, pkg_real)
+            collected.update(dict.fromkeys(entries))
             continue
         _collect_manifest_ancillary(
-            pkg_path,
+            pkg_real,
             name,
-            seen=seen,
             collected=collected,
         )
-    return collected
+    return list(collected)
 
 
-def _normalize_publish_path(pkg_path: Path, entry: str) -> str | None:
-    candidate = Path(entry)
-    resolved = candidate if candidate.is_absolute() else pkg_path / candidate
+def _normalize_publish_path(pkg_real: str, entry: str) -> str | None:
     try:
-        resolved = resolved.resolve()
+        resolved = _realpath(_join(pkg_real, entry))
     except OSError:
         return None
-    if resolved.is_dir():
-        display = str(resolved)
-        if not candidate.is_absolute():
-            with suppress(ValueError):
-                display = resolved.relative_to(pkg_path).as_posix()
+    if _stat_kind(resolved) == "dir":
+        display = resolved
+        if not os.path.isabs(entry):  # noqa: PTH117 - plain str, no Path needed
+            display = _relative_posix(resolved, pkg_real) or display
         _info(f"Ignoring ancillary directory (no auto-expansion): {display}")
         return None
-    rel = _safe_rel_from_abs(str(resolved), str(pkg_path))
+    rel = _safe_rel_from_abs(resolved, pkg_real)
     if not rel:
         return None
     return _to_posix_rel(rel)
 
 
 def _collect_publish_ancillary(
-    pkg_path: Path,
+    pkg_real: str,
     ancillary_files: list[str] | None,
     safe_kwargs: Mapping[str, object],
 ) -> list[str]:
-    collected: list[str] = []
-    seen: set[str] = set()
+    collected: dict[str, None] = {}
 
     for entry in ancillary_files or []:
         if entry.startswith("@"):  # handled via allowlist specs
             continue
-        normalized = _normalize_publish_path(pkg_path, entry)
+        normalized = _normalize_publish_path(pkg_real, entry)
         if normalized:
-            _add_ancillary_entry(collected, seen, normalized)
+            collected[normalized] = None
 
-    pkg_dir_str = str(pkg_path)
     for spec in _normalize_allowlist_specs(safe_kwargs):
-        spec_path = pkg_path / (spec[1:].strip() if spec.startswith("@") else spec)
-        entries = _load_ancillary_allowlist(str(spec_path), pkg_dir_str)
+        spec_path = _join(pkg_real, spec[1:].strip() if spec.startswith("@") else spec)
+        entries = _load_ancillary_allowlist(spec_path, pkg_real)
         for rel in entries:
-            normalized = _normalize_publish_path(pkg_path, rel)
+            normalized = _normalize_publish_path(pkg_real, rel)
             if normalized:
-                _add_ancillary_entry(collected, seen, normalized)
+                collected[normalized] = None
 
-    if len(collected) > 1:
-        collected.sort()
-    return collected
+    return sorted(collected) if len(collected) > 1 else list(collected)
 
 
 def _build_publish_context(
@@ -470,10 +616,12 @@ def _build_publish_context(
         for key, value in local_kwargs.items()
         if key not in {"dry_run", "cleanup_evidence"}
     }
-    main_path = Path(main_file).resolve()
+    main_real = _realpath(main_file)
+    main_path = Path(main_real)
     pkg_path = main_path.parent
+    pkg_real = os.fspath(pkg_path)
     ancillary_rel = _collect_publish_ancillary(
-        pkg_path,
+        pkg_real,
         ancillary_files,
         safe_kwargs,
     )
@@ -482,11 +630,48 @@ def _build_publish_context(
         version=version,
         main_path=main_path,
         pkg_path=pkg_path,
+        pkg_real=pkg_real,
+        main_rel=_safe_rel_from_abs(main_real, pkg_real),
         ancillary_rel=ancillary_rel,
         safe_kwargs=dict(safe_kwargs),
     )
 
 
+@dataclass(slots=True)
+class _EntryResult:
+    # One run-report record per manifest entry. Slots keep the per-entry
+    # footprint small; the dict form is built once, when the report is written.
+    package: str
+    distribution: str
+    version: str
+    main_file: str
+    ancillary_publish: list[str]
+    ancillary_manifest: list[str]
+    package_dir: str
+    safe_kwargs: JSONValue
+    status: str = "pending"
+    skip_reason: str | None = None
+    error: str | None = None
+
+    def as_report(self) -> dict[str, object]:
+        report: dict[str, object] = {
+            "package": self.package,
+            "distribution": self.distribution,
+            "version": self.version,
+            "main_file": self.main_file,
+            "ancillary_publish": self.ancillary_publish,
+            "ancillary_manifest": self.ancillary_manifest,
+            "package_dir": self.package_dir,
+            "safe_kwargs": self.safe_kwargs,
+            "status": self.status,
+        }
+        if self.skip_reason is not None:
+            report["skip_reason"] = self.skip_reason
+        if self.error is not None:
+            report["error"] = self.error
+        return report
+
+
 def _repo_base_path(cloner: object, fallback_parent: Path) -> Path:
     base_path = fallback_parent
     target_attr: object = getattr(cloner, "target_dir", None)
@@ -504,8 +689,8 @@ def _repo_base_path(cloner: object, fallback_parent: Path) -> Path:
 
 
 def _ensure_package_dir(base_path: Path, pkg: str) -> Path:
-    pkg_path = (base_path / pkg).resolve()
-    if not pkg_path.is_dir():
+    pkg_path = Path(_realpath(_join(base_path, pkg)))
+    if _stat_kind(str(pkg_path)) != "dir":
         msg = f"Repo package directory not found for {pkg!r} at {pkg_path}"
         raise FileNotFoundError(msg)
     return pkg_path
@@ -518,20 +703,25 @@ def _derive_main_basename(pkg: str, main_basename: str | None) -> str:
 
 
 def _discover_main_file(pkg_path: Path, basename: str) -> Path:
-    candidate = (pkg_path / basename).resolve()
-    if candidate.is_file():
-        return candidate
-    try:
-        children = sorted(pkg_path.iterdir())
-    except OSError:
-        children = []
-    for child in children:
-        if (
-            child.name.startswith("x_cls_make_")
-            and child.suffix == ".py"
-            and child.is_file()
-        ):
-            return child.resolve()
+    candidate = _realpath(_join(pkg_path, basename))
+    if _stat_kind(candidate) == "file":
+        return Path(candidate)
+    # Filter on the dirent name before touching the filesystem again, and take
+    # the lexicographically first match so the choice stays deterministic
+    # without sorting the whole directory.
+    first: str | None = None
+    with suppress(OSError), os.scandir(pkg_path) as children:
+        for child in children:
+            name = child.name
+            if (
+                name.startswith("x_cls_make_")
+                and name.endswith(".py")
+                and (first is None or name < first)
+                and child.is_file()
+            ):
+                first = name
+    if first is not None:
+        return Path(_realpath(_join(pkg_path, first)))
     msg = (
         "Could not locate main file in repo for "
         f"package {pkg_path.name!r} (expected {basename})"
@@ -555,6 +745,92 @@ def _locate_repo_main_and_ancillaries(
     return str(main_path), anc_rel
 
 
+def _shape_ctx_keyword(
+    factory: PublisherFactory,
+    name: str,
+    version: str,
+    ctx: object | None,
+    safe_kwargs: dict[str, object],
+) -> PublisherProtocol:
+    return factory(name=name, version=version, ctx=ctx, **safe_kwargs)
+
+
+def _shape_ctx_merged(
+    factory: PublisherFactory,
+    name: str,
+    version: str,
+    ctx: object | None,
+    safe_kwargs: dict[str, object],
+) -> PublisherProtocol:
+    return factory(name=name, version=version, **dict(safe_kwargs, ctx=ctx))
+
+
+def _shape_positional(
+    factory: PublisherFactory,
+    name: str,
+    version: str,
+    ctx: object | None,
+    _safe_kwargs: dict[str, object],
+) -> PublisherProtocol:
+    return factory(name, version, ctx)
+
+
+def _shape_no_ctx(
+    factory: PublisherFactory,
+    name: str,
+    version: str,
+    _ctx: object | None,
+    safe_kwargs: dict[str, object],
+) -> PublisherProtocol:
+    return factory(name=name, version=version, **safe_kwargs)
+
+
+# Constructor call shapes, tried in order until one is accepted.
+_PUBLISHER_SHAPES = (
+    _shape_ctx_keyword,
+    _shape_ctx_merged,
+    _shape_positional,
+    _shape_no_ctx,
+)
+_PUBLISHER_SHAPE_CODES = frozenset(shape.__code__ for shape in _PUBLISHER_SHAPES)
+# Index of the shape each factory accepted for a given set of keyword names,
+# so later entries skip straight to it instead of raising and discarding a
+# TypeError per rejected shape. Which shape fits depends on the kwargs as well
+# as the factory (an unknown keyword pushes it down to the positional shape).
+_PUBLISHER_SHAPE_CACHE: weakref.WeakKeyDictionary[object, dict[frozenset[str], int]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _is_call_mismatch(exc: TypeError) -> bool:
+    # A signature mismatch is raised at the call site inside the shape helper,
+    # before any frame of the factory runs. A TypeError from inside the
+    # factory body must not teach the cache a shape.
+    tb = exc.__traceback__
+    if tb is None:
+        return False
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+    return tb.tb_frame.f_code in _PUBLISHER_SHAPE_CODES
+
+
+def _cached_shape(
+    publisher_cls: PublisherFactory, kwarg_names: frozenset[str]
+) -> int | None:
+    with suppress(TypeError):  # factory does not support weak references
+        shapes = _PUBLISHER_SHAPE_CACHE.get(publisher_cls)
+        if shapes is not None:
+            return shapes.get(kwarg_names)
+    return None
+
+
+def _remember_shape(
+    publisher_cls: PublisherFactory, kwarg_names: frozenset[str], index: int
+) -> None:
+    with suppress(TypeError):  # factory does not support weak references
+        _PUBLISHER_SHAPE_CACHE.setdefault(publisher_cls, {})[kwarg_names] = index
+
+
 def _instantiate_publisher(
     publisher_cls: PublisherFactory,
     name: str,
@@ -563,19 +839,40 @@ def _instantiate_publisher(
     ctx: object | None,
     safe_kwargs: dict[str, object],
 ) -> PublisherProtocol:
-    try:
-        return publisher_cls(name=name, version=version, ctx=ctx, **safe_kwargs)
-    except TypeError:
-        pass
-    try:
-        return publisher_cls(name=name, version=version, **dict(safe_kwargs, ctx=ctx))
-    except TypeError:
-        pass
-    try:
-        return publisher_cls(name, version, ctx)
-    except TypeError:
-        pass
-    return publisher_cls(name=name, version=version, **safe_kwargs)
+    kwarg_names = frozenset(safe_kwargs)
+    cached = _cached_shape(publisher_cls, kwarg_names)
+    cached_error: TypeError | None = None
+    mismatches_only = True
+    if cached is not None:
+        try:
+            return _PUBLISHER_SHAPES[cached](
+                publisher_cls, name, version, ctx, safe_kwargs
+            )
+        except TypeError as exc:
+            cached_error = exc
+            mismatches_only = _is_call_mismatch(exc)
+    *guarded, final = range(len(_PUBLISHER_SHAPES))
+    for index in guarded:
+        if index == cached:
+            continue
+        try:
+            publisher = _PUBLISHER_SHAPES[index](
+                publisher_cls, name, version, ctx, safe_kwargs
+            )
+        except TypeError as exc:
+            mismatches_only = mismatches_only and _is_call_mismatch(exc)
+            continue
+        if mismatches_only:
+            _remember_shape(publisher_cls, kwarg_names, index)
+        return publisher
+    if cached_error is not None and cached == final:
+        # The last shape already ran (and failed) as the cached attempt; the
+        # factory is never called twice with the same shape.
+        raise cached_error
+    publisher = _PUBLISHER_SHAPES[final](publisher_cls, name, version, ctx, safe_kwargs)
+    if mismatches_only:
+        _remember_shape(publisher_cls, kwarg_names, final)
+    return publisher
 
 
 def _execute_publish(
@@ -595,21 +892,23 @@ def _execute_publish(
         return publisher.publish(main_rel, context.ancillary_rel)
 
 
+# Upload failures meaning the release is already on the index; one
+# case-insensitive pass replaces lowering the message and scanning per marker.
+_SKIP_MARKERS = re.compile(
+    "file already exists|400 bad request|file-name-reuse|already exists on pypi",
+    re.IGNORECASE,
+)
+
+
 def _should_skip_publish_exception(
     exc: BaseException,
     name: str,
     version: str,
 ) -> bool:
-    message = _exception_summary(exc)
-    lowered = message.lower()
-    if any(
-        marker in lowered
-        for marker in (
-            "file already exists",
-            "400 bad request",
-            "file-name-reuse",
-            "already exists on pypi",
-        )
+    # Most index rejections name themselves in the message; only fall back to
+    # scanning the captured streams when the short form has no marker.
+    if _SKIP_MARKERS.search(_exception_short(exc)) or _SKIP_MARKERS.search(
+        " ".join(_iter_exception_streams(exc))
     ):
         message = (
             f"SKIP: {name} version {version} already exists on PyPI. "
@@ -628,8 +927,7 @@ def _record_publish_result(
     published_artifacts: dict[str, dict[str, object]],
 ) -> None:
     published_versions[context.name] = context.version if published else None
-    rel_main = _safe_rel_from_abs(str(context.main_path), str(context.pkg_path))
-    rel_main = _to_posix_rel(rel_main or context.main_path.name)
+    rel_main = _to_posix_rel(context.main_rel or context.main_path.name)
     published_artifacts[context.name] = {
         "main": rel_main,
         "anc": context.ancillary_rel,
@@ -640,20 +938,25 @@ def _record_publish_result(
         _info(f"publish skipped for {context.name} {context.version} (minimal stub)")
 
 
-def _check_test_pypi(token_env: str = TEST_PYPI_TOKEN_ENV) -> None:
+def _check_test_pypi(
+    token_env: str = TEST_PYPI_TOKEN_ENV,
+    *,
+    client: HttpClient | None = None,
+) -> None:
     try:
         token = _read_user_env_var(token_env)
         url = "https://test.pypi.org/"
         headers = {"Authorization": f"token {token}"} if token else None
-        client = HttpClient(timeout=10.0)
+        session = client if client is not None else HttpClient(timeout=10.0)
         try:
-            client.head(url, headers=headers)
+            session.head(url, headers=headers)
         except HttpError as exc:
             message = f"test.pypi.org check failed: {exc}"
             raise AssertionError(message) from exc
         finally:
-            with suppress(RuntimeError):
-                client.close()
+            if client is None:
+                with suppress(RuntimeError):
+                    session.close()
     except AssertionError:
         raise
     except (OSError, RuntimeError, ValueError) as exc:
@@ -670,15 +973,23 @@ def publish_manifest_entries(  # noqa: PLR0913, PLR0915
     publisher_factory: PublisherFactory,
     token_env: str = TEST_PYPI_TOKEN_ENV,
 ) -> tuple[dict[str, str | None], dict[str, dict[str, object]], Path]:
+    _realpath.cache_clear()
+    _stat_kind.cache_clear()
+    _list_dir.cache_clear()
+    _listed_subdir.cache_clear()
+    # Wall-clock stamps are for the report fields only; the duration comes
+    # from the monotonic clock so clock adjustments cannot skew it.
     start_time = datetime.now(UTC)
+    start_ns = time.monotonic_ns()
     run_id = uuid.uuid4().hex
     published_versions: dict[str, str | None] = {}
     published_artifacts: dict[str, dict[str, object]] = {}
     fallback_parent = Path(repo_parent_root).resolve()
-    entry_results: list[dict[str, object]] = []
+    entry_results: list[_EntryResult] = []
     status = "running"
     caught_exc: Exception | None = None
     report_path: Path
+    options_kwargs = _options_kwargs_by_id(entries)
 
     manifest_inputs: list[dict[str, object]] = [
         {
@@ -687,7 +998,7 @@ def publish_manifest_entries(  # noqa: PLR0913, PLR0915
             "pypi_name": entry.options.pypi_name or entry.package,
             "ancillary": list(entry.ancillary),
             "options_kwargs": cast(
-                "object", _json_ready(options_to_kwargs(entry.options))
+                "object", _json_ready(options_kwargs[id(entry.options)])
             ),
         }
         for entry in entries
@@ -714,7 +1025,7 @@ def publish_manifest_entries(  # noqa: PLR0913, PLR0915
             "publisher_factory": publisher_identifier,
         },
         "result": {
-            "entries": entry_results,
+            "entries": [],
             "published_versions": published_versions,
             "published_artifacts": published_artifacts,
         },
@@ -737,8 +1048,7 @@ def publish_manifest_entries(  # noqa: PLR0913, PLR0915
                 anc_names,
                 fallback_parent=fallback_parent,
             )
-            extra_kwargs = options_to_kwargs(entry.options)
-            local_kwargs = dict(extra_kwargs)
+            local_kwargs = dict(options_kwargs[id(entry.options)])
             local_kwargs["force_publish"] = True
             context = _build_publish_context(
                 dist_name,
@@ -747,24 +1057,22 @@ def publish_manifest_entries(  # noqa: PLR0913, PLR0915
                 anc,
                 local_kwargs,
             )
-            rel_main = _safe_rel_from_abs(str(context.main_path), str(context.pkg_path))
-            record: dict[str, object] = {
-                "package": repo_name,
-                "distribution": context.name,
-                "version": context.version,
-                "main_file": rel_main or context.main_path.name,
-                "ancillary_publish": list(context.ancillary_rel),
-                "ancillary_manifest": list(anc_names),
-                "package_dir": str(context.pkg_path),
-                "safe_kwargs": _json_ready(context.safe_kwargs),
-                "status": "pending",
-            }
+            record = _EntryResult(
+                package=repo_name,
+                distribution=context.name,
+                version=context.version,
+                main_file=context.main_rel or context.main_path.name,
+                ancillary_publish=list(context.ancillary_rel),
+                ancillary_manifest=list(anc_names),
+                package_dir=context.pkg_real,
+                safe_kwargs=_json_ready(context.safe_kwargs),
+            )
             entry_results.append(record)
 
             _info(f"Publishing {context.name} version {context.version}")
             try:
                 published = _execute_publish(context, ctx, publisher_factory)
-                record["status"] = "published"
+                record.status = "published"
             except (
                 RuntimeError,
                 ValueError,
@@ -773,11 +1081,11 @@ def publish_manifest_entries(  # noqa: PLR0913, PLR0915
             ) as exc:
                 if _should_skip_publish_exception(exc, context.name, context.version):
                     published = True
-                    record["status"] = "skipped_existing"
-                    record["skip_reason"] = _exception_summary(exc)
+                    record.status = "skipped_existing"
+                    record.skip_reason = _exception_summary(exc)
                 else:
-                    record["status"] = "error"
-                    record["error"] = _exception_summary(exc)
+                    record.status = "error"
+                    record.error = _exception_summary(exc)
                     _error(f"Failed to publish {context.name}: {exc}")
                     raise
             _record_publish_result(
@@ -788,7 +1096,7 @@ def publish_manifest_entries(  # noqa: PLR0913, PLR0915
             )
 
         status = "completed"
-        if any(rec.get("status") == "skipped_existing" for rec in entry_results):
+        if any(rec.status == "skipped_existing" for rec in entry_results):
             status = "attention"
     except Exception as exc:
         status = "error"
@@ -799,14 +1107,16 @@ def publish_manifest_entries(  # noqa: PLR0913, PLR0915
         report_payload["status"] = status
         report_payload["completed_at"] = isoformat_timestamp(end_time)
         report_payload["duration_seconds"] = round(
-            (end_time - start_time).total_seconds(),
+            (time.monotonic_ns() - start_ns) / 1e9,
             3,
         )
+        # Records, versions, and artifact maps hold only strings, string
+        # lists, and already-normalised kwargs, so they are reported as-is.
         report_payload["result"] = {
             "status": status,
-            "entries": [_json_ready(entry) for entry in entry_results],
-            "published_versions": _json_ready(published_versions),
-            "published_artifacts": _json_ready(published_artifacts),
+            "entries": [record.as_report() for record in entry_results],
+            "published_versions": published_versions,
+            "published_artifacts": published_artifacts,
         }
         report_path = write_run_report(
             "x_make_pypi_x",
@@ -823,13 +1133,33 @@ def publish_manifest_entries(  # noqa: PLR0913, PLR0915
     return published_versions, published_artifacts, report_path
 
 
-def _candidate_release_available(
+def _is_not_modified(outcome: object) -> bool:
+    # HttpClient surfaces a 304 either as a response or as an HttpError,
+    # depending on its redirect handling; accept both spellings of the code.
+    return any(
+        getattr(outcome, attr, None) == HTTPStatus.NOT_MODIFIED
+        for attr in ("status", "status_code")
+    )
+
+
+def _remember_etag(etags: dict[str, str], candidate: str, response: object) -> None:
+    headers = cast("object | None", getattr(response, "headers", None))
+    if not isinstance(headers, Mapping):
+        return
+    typed_headers = cast("Mapping[str, object]", headers)
+    etag = typed_headers.get("ETag") or typed_headers.get("etag")
+    if isinstance(etag, str) and etag:
+        etags[candidate] = etag
+
+
+def _candidate_release_available(  # noqa: PLR0913
     client: HttpClient,
     *,
     package_name: str,
     version: str,
     candidate: str,
     attempt_no: int,
+    etags: dict[str, str],
 ) -> bool:
     project_url = f"https://pypi.org/project/{candidate}/{version}/"
     try:
@@ -845,11 +1175,33 @@ def _candidate_release_available(
             ),
         )
         return True
+    return _json_lists_release(
+        client,
+        package_name=package_name,
+        version=version,
+        candidate=candidate,
+        attempt_no=attempt_no,
+        etags=etags,
+    )
 
+
+def _json_lists_release(  # noqa: PLR0913
+    client: HttpClient,
+    *,
+    package_name: str,
+    version: str,
+    candidate: str,
+    attempt_no: int,
+    etags: dict[str, str],
+) -> bool:
     json_url = f"https://pypi.org/pypi/{candidate}/json"
+    etag = etags.get(candidate)
+    headers = {"If-None-Match": etag} if etag else None
     try:
-        response = client.get(json_url)
+        response = client.get(json_url, headers=headers)
     except HttpError as exc:
+        if _is_not_modified(exc):
+            return False
         _info(
             "PyPI check attempt",
             attempt_no,
@@ -859,6 +1211,10 @@ def _candidate_release_available(
             exc,
         )
         return False
+    if _is_not_modified(response):
+        # Release list unchanged since the last full fetch, which lacked it.
+        return False
+    _remember_etag(etags, candidate, response)
 
     payload = response.json
     if not isinstance(payload, Mapping):
@@ -877,24 +1233,173 @@ def _candidate_release_available(
     return False
 
 
-def wait_for_pypi_release(
+def _poll_candidates(  # noqa: PLR0913
+    executor: ThreadPoolExecutor | None,
+    clients: Mapping[str, HttpClient],
+    *,
+    package_name: str,
+    version: str,
+    attempt_no: int,
+    etags: dict[str, str],
+    timeout: float,
+    in_flight: dict[str, Future[bool]],
+) -> bool:
+    if executor is None:
+        # One shared client: probe the candidates one after another.
+        return any(
+            _candidate_release_available(
+                client,
+                package_name=package_name,
+                version=version,
+                candidate=candidate,
+                attempt_no=attempt_no,
+                etags=etags,
+            )
+            for candidate, client in clients.items()
+        )
+    # A candidate whose probe outlived the previous attempt keeps that future
+    # rather than starting a second request on the same client.
+    futures: dict[Future[bool], str] = {}
+    for candidate, client in clients.items():
+        future = in_flight.get(candidate)
+        if future is None:
+            future = executor.submit(
+                _candidate_release_available,
+                client,
+                package_name=package_name,
+                version=version,
+                candidate=candidate,
+                attempt_no=attempt_no,
+                etags=etags,
+            )
+            in_flight[candidate] = future
+        futures[future] = candidate
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            del in_flight[futures[future]]
+            if future.result():
+                return True
+    except FuturesTimeoutError:
+        pass
+    return False
+
+
+def _close_client(client: HttpClient, _done: object = None) -> None:
+    with suppress(RuntimeError):
+        client.close()
+
+
+def _close_when_idle(
+    clients: Mapping[str, HttpClient], in_flight: Mapping[str, Future[bool]]
+) -> None:
+    # Return without waiting on a straggling probe, but close its client only
+    # once that probe has finished with it.
+    for candidate, client in clients.items():
+        future = in_flight.get(candidate)
+        if future is None:
+            _close_client(client)
+        else:
+            future.add_done_callback(functools.partial(_close_client, client))
+
+
+# Releases confirmed visible on PyPI, keyed "name==version" with the time they
+# were first seen. Writes go through an atomic replace, so readers never see a
+# torn file; two processes racing can drop each other's newest entry, which
+# only costs that pair one more poll.
+_RELEASE_CACHE_PATH = PACKAGE_ROOT / ".cache" / "seen_releases.json"
+_RELEASE_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def _load_seen_releases(now: float) -> dict[str, float]:
+    try:
+        raw = loads(_RELEASE_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(raw, dict):
+        return {}
+    seen: dict[str, float] = {}
+    for key, stamp in cast("dict[object, object]", raw).items():
+        if (
+            isinstance(key, str)
+            and isinstance(stamp, (int, float))
+            and not isinstance(stamp, bool)
+            and now - stamp < _RELEASE_CACHE_TTL_SECONDS
+        ):
+            seen[key] = float(stamp)
+    return seen
+
+
+def _release_already_seen(name: str, version: str) -> bool:
+    return f"{name}=={version}" in _load_seen_releases(time.time())
+
+
+def _remember_release(name: str, version: str) -> None:
+    now = time.time()
+    seen = _load_seen_releases(now)
+    seen.setdefault(f"{name}=={version}", now)
+    cache_dir = _RELEASE_CACHE_PATH.parent
+    tmp_path: Path | None = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=cache_dir, suffix=".tmp", delete=False
+        ) as handle:
+            tmp_path = Path(handle.name)
+            handle.write(dumps(seen))
+        tmp_path.replace(_RELEASE_CACHE_PATH)
+    except OSError as exc:
+        # A failed write or swap must not strand the temp file in .cache/.
+        if tmp_path is not None:
+            with suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+        _info(f"Could not update PyPI release cache {_RELEASE_CACHE_PATH}: {exc}")
+
+
+def _poll_clients(
+    candidates: tuple[str, ...], client: HttpClient | None, client_timeout: float
+) -> tuple[dict[str, HttpClient], ThreadPoolExecutor | None]:
+    # Without a caller-owned client, one client per candidate so the
+    # concurrent probes never share a connection. A caller-owned client gets
+    # no executor: its probes run sequentially on the calling thread.
+    if client is not None:
+        return dict.fromkeys(candidates, client), None
+    clients = {
+        candidate: HttpClient(timeout=client_timeout) for candidate in candidates
+    }
+    executor = ThreadPoolExecutor(
+        max_workers=len(candidates), thread_name_prefix="pypi-poll"
+    )
+    return clients, executor
+
+
+def wait_for_pypi_release(  # noqa: PLR0913
     name: str,
     version: str,
     *,
     timeout: int = 120,
     initial_delay: float = 5.0,
     client_timeout: float = 10.0,
+    client: HttpClient | None = None,
 ) -> bool:
+    # A caller-owned ``client`` lets the orchestrator reuse one keep-alive
+    # client across calls. It is not assumed to be thread-safe, so the
+    # candidates are then probed sequentially, and it is left open on return.
     if timeout <= 0:
         return False
+    if _release_already_seen(name, version):
+        _info("PyPI:", f"{name}=={version} already confirmed available (cached)")
+        return True
     deadline = time.time() + timeout
-    candidates = (name, name.replace("_", "-"))
+    candidates = tuple(dict.fromkeys((name, name.replace("_", "-"))))
     sleep_window = min(initial_delay, timeout)
     if sleep_window > 0:
         time.sleep(sleep_window)
     attempt = 0
     backoff = 1.0
-    client = HttpClient(timeout=client_timeout)
+    clients, executor = _poll_clients(candidates, client, client_timeout)
+    # ETags let repeat JSON polls come back as cheap 304s.
+    etags: dict[str, str] = {}
+    in_flight: dict[str, Future[bool]] = {}
 
     last_heartbeat = time.time()
     heartbeat_interval = 5.0
@@ -902,16 +1407,21 @@ def wait_for_pypi_release(
     try:
         while time.time() < deadline:
             attempt += 1
-            for candidate in candidates:
-                if _candidate_release_available(
-                    client,
-                    package_name=name,
-                    version=version,
-                    candidate=candidate,
-                    attempt_no=attempt,
-                ):
-                    return True
+            if _poll_candidates(
+                executor,
+                clients,
+                package_name=name,
+                version=version,
+                attempt_no=attempt,
+                etags=etags,
+                timeout=max(deadline - time.time(), 0.0),
+                in_flight=in_flight,
+            ):
+                _remember_release(name, version)
+                return True
             now = time.time()
+            if now >= deadline:
+                break
             if now - last_heartbeat >= heartbeat_interval:
                 remaining = max(deadline - now, 0.0)
                 _info(
@@ -925,8 +1435,9 @@ def wait_for_pypi_release(
             time.sleep(min(backoff, deadline - time.time()))
             backoff = min(backoff * 2.0, 10.0)
     finally:
-        with suppress(RuntimeError):
-            client.close()
+        if executor is not None:
+            executor.shutdown(wait=False)
+            _close_when_idle(clients, in_flight)
 
     _info(
         "Timed out waiting for",
@@ -2,7 +2,24 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from .pypi_patching import PatchedPypiModule
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
+
+
+@pytest.fixture
+def patched_pypi_module() -> Iterator[PatchedPypiModule]:
+    patched = PatchedPypiModule()
+    try:
+        yield patched
+    finally:
+        patched.restore()
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import NoReturn, Protocol
+
+
+class SupportsMonkeyPatch(Protocol):
+    def setattr(
+        self,
+        obj: object,
+        name: str,
+        value: object,
+        *,
+        raising: bool = ...,
+    ) -> None: ...
+
+    def delenv(self, name: str, *, raising: bool = ...) -> None: ...
+
+    def setenv(self, name: str, value: str) -> None: ...
+
+
+def raise_failure(message: str) -> NoReturn:
+    failure_message = message
+    raise AssertionError(failure_message)
+
+
+def expect(*, condition: bool, message: str) -> None:
+    if not condition:
+        raise_failure(message)
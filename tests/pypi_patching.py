@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import ModuleType
+
+_MISSING = object()
+_PUBLISH_ATTR = "publish_manifest_entries"
+
+
+class PatchedPypiModule:
+    # Patches for the main_json tests. Each patch appends one undo callback
+    # and restore() unwinds them in reverse, once, at fixture teardown.
+
+    def __init__(self) -> None:
+        self.module = importlib.import_module("x_make_pypi_x.x_cls_make_pypi_x")
+        self._undo: list[Callable[[], None]] = []
+
+    def set_publish(self, publish: Callable[..., object]) -> None:
+        module = self.module
+        original: object = getattr(module, _PUBLISH_ATTR)
+        setattr(module, _PUBLISH_ATTR, publish)
+        self._undo.append(lambda: setattr(module, _PUBLISH_ATTR, original))
+
+    def install_fake_module(self, name: str, module: ModuleType) -> None:
+        previous = sys.modules.get(name, _MISSING)
+        sys.modules[name] = module
+
+        def _restore() -> None:
+            if previous is _MISSING:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = cast("ModuleType", previous)
+
+        self._undo.append(_restore)
+
+    def restore(self) -> None:
+        while self._undo:
+            self._undo.pop()()
@@ -1,31 +1,50 @@
 from __future__ import annotations
 
+import copy
+import functools
 import json
 from pathlib import Path
 from typing import cast
 
 import pytest
+from jsonschema import ValidationError
 
-from x_make_common_x.json_contracts import validate_payload, validate_schema
+from x_make_common_x.json_contracts import validate_schema
+from x_make_pypi_x import json_contracts
 from x_make_pypi_x.json_contracts import (
     ERROR_SCHEMA,
     INPUT_SCHEMA,
     OUTPUT_SCHEMA,
+    get_validator,
+    is_valid_error,
+    is_valid_input,
+    is_valid_output,
+    validate_error,
+    validate_input,
+    validate_output,
 )
 
 FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures" / "json_contracts"
 REPORTS_DIR = Path(__file__).resolve().parents[1] / "reports"
+# One test item per committed run report, so a bad report is named directly
+# and xdist can spread the sweep across workers.
+_REPORT_FILES = sorted(REPORTS_DIR.glob("x_make_pypi_x_run_*.json"))
 
 
-def _load_fixture(name: str) -> dict[str, object]:
+@functools.cache
+def _read_fixture(name: str) -> dict[str, object]:
     path = FIXTURE_DIR / f"{name}.json"
-    with path.open("r", encoding="utf-8") as handle:
-        payload_obj: object = json.load(handle)
+    payload_obj = json_contracts.loads(path.read_bytes())
     if not isinstance(payload_obj, dict):
         message = f"Fixture payload must be an object: {name}"
         raise TypeError(message)
-    typed_payload = cast("dict[str, object]", payload_obj)
-    return dict(typed_payload)
+    return cast("dict[str, object]", payload_obj)
+
+
+def _load_fixture(name: str) -> dict[str, object]:
+    # Each fixture file is decoded once per session; callers get a deep copy
+    # so edits at any depth in one test never leak into the next.
+    return copy.deepcopy(_read_fixture(name))
 
 
 def test_schemas_are_valid() -> None:
@@ -34,25 +53,150 @@ def test_schemas_are_valid() -> None:
 
 
 def test_sample_payloads_match_schema() -> None:
-    sample_input = _load_fixture("input")
-    sample_output = _load_fixture("output")
-    sample_error = _load_fixture("error")
-    validate_payload(sample_input, INPUT_SCHEMA)
-    validate_payload(sample_output, OUTPUT_SCHEMA)
-    validate_payload(sample_error, ERROR_SCHEMA)
-
-
-def test_existing_reports_align_with_schema() -> None:
-    if not REPORTS_DIR.exists():
-        pytest.skip("no reports directory for pypi tool")
-    report_files = sorted(REPORTS_DIR.glob("x_make_pypi_x_run_*.json"))
-    if not report_files:
-        pytest.skip("no pypi run reports to validate")
-    for report_file in report_files:
-        with report_file.open("r", encoding="utf-8") as handle:
-            payload_obj: object = json.load(handle)
-        if not isinstance(payload_obj, dict):
-            message = f"Report payload must be an object: {report_file}"
-            raise TypeError(message)
-        typed_payload = cast("dict[str, object]", payload_obj)
-        validate_payload(dict(typed_payload), OUTPUT_SCHEMA)
+    for kind in ("input", "output", "error"):
+        get_validator(kind).validate(_load_fixture(kind))
+
+
+def test_compiled_validators_accept_samples() -> None:
+    validate_input(_load_fixture("input"))
+    validate_output(_load_fixture("output"))
+    validate_error(_load_fixture("error"))
+
+
+def test_load_fixture_isolates_nested_edits() -> None:
+    first = _load_fixture("input")
+    parameters = cast("dict[str, object]", first["parameters"])
+    cast("list[object]", parameters["entries"]).clear()
+    validate_input(_load_fixture("input"))
+
+
+def test_compiled_validators_reject_invalid_payload() -> None:
+    with pytest.raises(ValidationError):
+        validate_input({})
+
+
+def test_is_valid_predicates_match_validators() -> None:
+    predicates = (is_valid_input, is_valid_output, is_valid_error)
+    for predicate, name in zip(predicates, ("input", "output", "error"), strict=True):
+        if not predicate(_load_fixture(name)):
+            message = f"is_valid_{name} rejected the sample payload"
+            raise AssertionError(message)
+        if predicate({}):
+            message = f"is_valid_{name} accepted an empty payload"
+            raise AssertionError(message)
+
+
+@pytest.mark.parametrize(
+    "envelope",
+    [
+        {"command": "x_make_other_x", "parameters": {}},
+        {"command": "x_make_pypi_x", "parameters": []},
+    ],
+)
+def test_is_valid_input_rejects_foreign_envelopes(envelope: dict[str, object]) -> None:
+    payload = {**_load_fixture("input"), **envelope}
+    if is_valid_input(payload):
+        message = "is_valid_input accepted a payload with a foreign envelope"
+        raise AssertionError(message)
+    with pytest.raises(ValidationError):
+        validate_input(payload)
+
+
+@pytest.mark.parametrize("run_id", ["A" * 32, "g" * 32, "0" * 31 + "-"])
+def test_compiled_validators_reject_malformed_run_id(run_id: str) -> None:
+    payload = _load_fixture("output")
+    payload["run_id"] = run_id
+    with pytest.raises(ValidationError):
+        validate_output(payload)
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        "2025-10-20",
+        "2025-10-20T21:19:19",
+        "2025-10-20 21:19:19Z",
+        "2025-10-20T21:19Z",
+        "2025-10-20T21Z",
+        "2025-W43-1T21:19:19Z",
+        "2025-10-20T21:19:19+05",
+        "2025-10-20T211919Z",
+        "2025-13-20T21:19:19Z",
+        "2025-10-20T24:19:19Z",
+        "2025-10-20T21:19:19+24:00",
+    ],
+)
+def test_compiled_validators_reject_non_rfc3339_timestamp(timestamp: str) -> None:
+    payload = _load_fixture("output")
+    payload["started_at"] = timestamp
+    with pytest.raises(ValidationError):
+        validate_output(payload)
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        "2025-10-20T21:19:19Z",
+        "2025-10-20t21:19:19z",
+        "2025-10-20T21:19:19.123456789Z",
+        "2025-10-20T21:19:19+05:30",
+        "2025-10-20T21:19:19-00:00",
+    ],
+)
+def test_compiled_validators_accept_rfc3339_timestamp(timestamp: str) -> None:
+    payload = _load_fixture("output")
+    payload["started_at"] = timestamp
+    validate_output(payload)
+
+
+def test_json_helpers_round_trip_payload() -> None:
+    payload = _load_fixture("output")
+    if json_contracts.loads(json_contracts.dumps(payload, pretty=True)) != payload:
+        message = "dumps/loads should round-trip contract payloads"
+        raise AssertionError(message)
+    with pytest.raises(json.JSONDecodeError):
+        json_contracts.loads("{")
+
+
+def test_string_list_fields_share_one_definition() -> None:
+    dependencies = json_contracts._DEPENDENCIES_SCHEMA  # noqa: SLF001
+    allowlist = json_contracts._ALLOWLIST_SCHEMA  # noqa: SLF001
+    string_list = json_contracts._STRING_LIST_REF  # noqa: SLF001
+    if not (dependencies is allowlist is string_list):
+        message = "string-list fields should alias the StringArray reference"
+        raise AssertionError(message)
+
+
+def test_runtime_schema_drops_dialect_uri_only() -> None:
+    runtime = json_contracts._runtime_schema(OUTPUT_SCHEMA)  # noqa: SLF001
+    if "$schema" in runtime or "$schema" not in OUTPUT_SCHEMA:
+        message = "$schema belongs on the exported schema, not the runtime copy"
+        raise AssertionError(message)
+
+
+def test_get_validator_is_cached_per_contract() -> None:
+    if get_validator("output") is not get_validator("output"):
+        message = "get_validator should reuse the compiled validator"
+        raise AssertionError(message)
+    get_validator("output").validate(_load_fixture("output"))
+
+
+def test_generated_validators_match_contracts() -> None:
+    generated = pytest.importorskip("x_make_pypi_x._contract_validators")
+    fingerprints = cast("dict[str, str]", generated.SCHEMA_FINGERPRINTS)
+    contracts = json_contracts._CONTRACTS  # noqa: SLF001
+    for kind, schema in contracts.items():
+        runtime = json_contracts._runtime_schema(schema)  # noqa: SLF001
+        expected = json_contracts._schema_fingerprint(runtime)  # noqa: SLF001
+        if fingerprints.get(kind) != expected:
+            message = f"Stale {kind} validator; run python tools/gen_validators.py"
+            raise AssertionError(message)
+
+
+@pytest.mark.parametrize("report_file", _REPORT_FILES, ids=lambda path: path.name)
+def test_existing_reports_align_with_schema(report_file: Path) -> None:
+    payload_obj = json_contracts.loads(report_file.read_bytes())
+    if not isinstance(payload_obj, dict):
+        message = f"Report payload must be an object: {report_file}"
+        raise TypeError(message)
+    validate_output(cast("dict[str, object]", payload_obj))
@@ -1,66 +1,42 @@
 from __future__ import annotations
 
-import importlib
-import json
 import os
-import sys
 import uuid
-from collections.abc import Callable, Mapping, MutableMapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from types import ModuleType, SimpleNamespace
-from typing import TYPE_CHECKING, NoReturn, Protocol, cast
+from typing import TYPE_CHECKING, Protocol, cast
 
-from x_make_common_x.json_contracts import validate_payload
 from x_make_pypi_x import publish_flow
-from x_make_pypi_x.json_contracts import ERROR_SCHEMA, OUTPUT_SCHEMA
+from x_make_pypi_x.json_contracts import (
+    dumps,
+    loads,
+    validate_error,
+    validate_output,
+)
 from x_make_pypi_x.x_cls_make_pypi_x import main_json
 
+from .helpers import expect, raise_failure
+
 _SIMPLE_NAMESPACE_TYPE = type(SimpleNamespace())
 
 if TYPE_CHECKING:
     from pathlib import Path
 
     from x_make_pypi_x.publish_flow import PublisherFactory
+
+    from .helpers import SupportsMonkeyPatch
 else:
 
     class PublisherFactory(Protocol):
         def __call__(self, *args: object, **kwargs: object) -> object: ...
 
 
-class SupportsMonkeyPatch(Protocol):
-    def setitem(
-        self,
-        mapping: MutableMapping[str, object],
-        key: str,
-        value: object,
-    ) -> None: ...
-
-    def setattr(
-        self,
-        obj: object,
-        name: str,
-        value: object,
-        *,
-        raising: bool = ...,
-    ) -> None: ...
-
-    def delenv(self, name: str, *, raising: bool = ...) -> None: ...
-
-    def setenv(self, name: str, value: str) -> None: ...
-
-
-pypi_module = importlib.import_module("x_make_pypi_x.x_cls_make_pypi_x")
-
-
-def _raise_failure(message: str) -> NoReturn:
-    failure_message = message
-    raise AssertionError(failure_message)
+class SupportsPypiPatching(Protocol):
+    def set_publish(self, publish: Callable[..., object]) -> None: ...
 
-
-def expect(*, condition: bool, message: str) -> None:
-    if not condition:
-        _raise_failure(message)
+    def install_fake_module(self, name: str, module: ModuleType) -> None: ...
 
 
 _PrimeCredentials = Callable[[str], str]
@@ -78,55 +54,71 @@ def _iso(dt: datetime) -> str:
     return dt.astimezone(UTC).isoformat().replace("+00:00", "Z")
 
 
-def _run_report_payload(repo_root: Path) -> dict[str, object]:
-    return {
-        "run_id": "0123456789abcdef0123456789abcdef",
-        "started_at": _iso(datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)),
-        "inputs": {
-            "entry_count": 1,
-            "manifest_entries": [
-                {
-                    "package": "demo_pkg",
-                    "version": "1.2.3",
-                    "pypi_name": "demo_pkg",
-                    "ancillary": ["README.md"],
-                    "options_kwargs": {"force_publish": True},
-                }
-            ],
-            "repo_parent_root": str(repo_root),
-            "token_env": "CUSTOM_ENV",
-        },
-        "execution": {"publisher_factory": "FakePublisher"},
-        "result": {
-            "status": "completed",
-            "entries": [
-                {
-                    "package": "demo_pkg",
-                    "distribution": "demo_pkg",
-                    "version": "1.2.3",
-                    "main_file": "x_cls_make_demo_pkg.py",
-                    "ancillary_publish": ["README.md"],
-                    "ancillary_manifest": ["README.md"],
-                    "package_dir": f"{repo_root}/demo_pkg",
-                    "safe_kwargs": {"force_publish": True},
-                    "status": "published",
-                }
-            ],
-            "published_versions": {"demo_pkg": "1.2.3"},
-            "published_artifacts": {
-                "demo_pkg": {"main": "x_cls_make_demo_pkg.py", "anc": ["README.md"]}
-            },
-        },
+_STARTED_AT = _iso(datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC))
+_COMPLETED_AT = _iso(datetime(2025, 1, 1, 12, 5, 0, tzinfo=UTC))
+_REPORT_TEMPLATE: dict[str, object] = {
+    "run_id": "0123456789abcdef0123456789abcdef",
+    "started_at": _STARTED_AT,
+    "inputs": {
+        "entry_count": 1,
+        "manifest_entries": [
+            {
+                "package": "demo_pkg",
+                "version": "1.2.3",
+                "pypi_name": "demo_pkg",
+                "ancillary": ["README.md"],
+                "options_kwargs": {"force_publish": True},
+            }
+        ],
+        "repo_parent_root": "",
+        "token_env": "CUSTOM_ENV",
+    },
+    "execution": {"publisher_factory": "FakePublisher"},
+    "result": {
         "status": "completed",
-        "completed_at": _iso(datetime(2025, 1, 1, 12, 5, 0, tzinfo=UTC)),
-        "duration_seconds": 300.0,
-        "tool": "x_make_pypi_x",
-        "generated_at": _iso(datetime(2025, 1, 1, 12, 5, 0, tzinfo=UTC)),
-        "errors": [],
-    }
+        "entries": [
+            {
+                "package": "demo_pkg",
+                "distribution": "demo_pkg",
+                "version": "1.2.3",
+                "main_file": "x_cls_make_demo_pkg.py",
+                "ancillary_publish": ["README.md"],
+                "ancillary_manifest": ["README.md"],
+                "package_dir": "",
+                "safe_kwargs": {"force_publish": True},
+                "status": "published",
+            }
+        ],
+        "published_versions": {"demo_pkg": "1.2.3"},
+        "published_artifacts": {
+            "demo_pkg": {"main": "x_cls_make_demo_pkg.py", "anc": ["README.md"]}
+        },
+    },
+    "status": "completed",
+    "completed_at": _COMPLETED_AT,
+    "duration_seconds": 300.0,
+    "tool": "x_make_pypi_x",
+    "generated_at": _COMPLETED_AT,
+    "errors": [],
+}
 
 
-def _install_fake_publisher(monkeypatch: SupportsMonkeyPatch, module_name: str) -> None:
+def _run_report_payload(repo_root: Path) -> dict[str, object]:
+    # A JSON round trip deep-copies the all-JSON template faster than
+    # copy.deepcopy; only the repo-root paths vary per test.
+    root_str = os.fspath(repo_root)
+    payload = cast("dict[str, object]", loads(dumps(_REPORT_TEMPLATE)))
+    inputs = cast("dict[str, object]", payload["inputs"])
+    inputs["repo_parent_root"] = root_str
+    result = cast("dict[str, object]", payload["result"])
+    entries = cast("list[dict[str, object]]", result["entries"])
+    entries[0]["package_dir"] = f"{root_str}/demo_pkg"
+    return payload
+
+
+def _install_fake_publisher(
+    patched_pypi_module: SupportsPypiPatching, module_name: str
+) -> None:
     fake_module = ModuleType(module_name)
 
     class FakePublisher:
@@ -140,11 +132,7 @@ def _install_fake_publisher(monkeypatch: SupportsMonkeyPatch, module_name: str)
             return True
 
     fake_module.FakePublisher = FakePublisher  # type: ignore[attr-defined]
-    monkeypatch.setitem(
-        cast("MutableMapping[str, object]", sys.modules),
-        module_name,
-        fake_module,
-    )
+    patched_pypi_module.install_fake_module(module_name, fake_module)
 
 
 def _payload(template_repo_root: Path, publisher_identifier: str) -> dict[str, object]:
@@ -238,9 +226,11 @@ def _assert_publish_call(
     expect(condition=status_value == "completed", message="Expected completed status")
 
 
-def test_main_json_success(monkeypatch: SupportsMonkeyPatch, tmp_path: Path) -> None:
+def test_main_json_success(
+    patched_pypi_module: SupportsPypiPatching, tmp_path: Path
+) -> None:
     module_name = "tests.fake_publisher"
-    _install_fake_publisher(monkeypatch, module_name)
+    _install_fake_publisher(patched_pypi_module, module_name)
 
     captured_call: _PublishCall | None = None
 
@@ -281,22 +271,22 @@ def test_main_json_success(monkeypatch: SupportsMonkeyPatch, tmp_path: Path) ->
         report_payload = _run_report_payload(tmp_path)
         report_path = tmp_path / "reports" / "x_make_pypi_x_run_test.json"
         report_path.parent.mkdir(parents=True, exist_ok=True)
-        report_path.write_text(json.dumps(report_payload), encoding="utf-8")
+        report_path.write_text(dumps(report_payload), encoding="utf-8")
         versions: dict[str, str | None] = {"demo_pkg": "1.2.3"}
         artifacts: dict[str, dict[str, object]] = {
             "demo_pkg": {"main": "x_cls_make_demo_pkg.py", "anc": ["README.md"]}
         }
         return versions, artifacts, report_path
 
-    monkeypatch.setattr(pypi_module, "publish_manifest_entries", fake_publish)
+    patched_pypi_module.set_publish(fake_publish)
 
     payload = _payload(tmp_path, f"{module_name}:FakePublisher")
     result = main_json(payload)
 
-    validate_payload(result, OUTPUT_SCHEMA)
+    validate_output(result)
 
     if captured_call is None:
-        _raise_failure("publish_manifest_entries was not invoked")
+        raise_failure("publish_manifest_entries was not invoked")
 
     parameters_obj = cast("Mapping[str, object]", payload["parameters"])
     expected_token_env = cast("str", parameters_obj["token_env"])
@@ -309,7 +299,7 @@ def test_main_json_success(monkeypatch: SupportsMonkeyPatch, tmp_path: Path) ->
 
 
 def test_main_json_publish_failure(
-    monkeypatch: SupportsMonkeyPatch, tmp_path: Path
+    patched_pypi_module: SupportsPypiPatching, tmp_path: Path
 ) -> None:
     def failing_publish(
         *_args: object, **_kwargs: object
@@ -319,12 +309,12 @@ def test_main_json_publish_failure(
         exc.run_report_path = report_path  # type: ignore[attr-defined]
         raise exc
 
-    monkeypatch.setattr(pypi_module, "publish_manifest_entries", failing_publish)
+    patched_pypi_module.set_publish(failing_publish)
 
     payload = _payload(tmp_path, "XClsMakePypiX")
     result = main_json(payload)
 
-    validate_payload(result, ERROR_SCHEMA)
+    validate_error(result)
 
     details_obj = result.get("details")
     expect(
@@ -340,7 +330,7 @@ def test_main_json_publish_failure(
 
 def test_main_json_rejects_invalid_payload() -> None:
     result = main_json({})
-    validate_payload(result, ERROR_SCHEMA)
+    validate_error(result)
     status_value = result.get("status")
     expect(condition=isinstance(status_value, str), message="Status must be a string")
     expect(condition=status_value == "failure", message="Invalid payload should fail")
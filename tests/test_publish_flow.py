@@ -0,0 +1,517 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, NoReturn, cast
+
+import pytest
+from x_make_common_x import HttpError
+from x_make_pypi_x import publish_flow
+from x_make_pypi_x.json_contracts import dumps, loads
+
+from .helpers import expect, raise_failure
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+    from pathlib import Path
+
+    from x_make_common_x import HttpClient
+
+    from .helpers import SupportsMonkeyPatch
+
+
+_CANDIDATES = ("x_make_demo_x", "x-make-demo-x")
+
+
+class _FakeHttpError(HttpError):
+    def __init__(self, status: int) -> None:
+        Exception.__init__(self, f"HTTP {status}")
+        self.status = status
+
+
+@dataclass
+class _FakeResponse:
+    json: object = None
+    headers: dict[str, str] = field(default_factory=dict)
+    status: int = 200
+
+
+@dataclass
+class _Call:
+    method: str
+    url: str
+    headers: Mapping[str, str] | None
+    thread: int
+
+
+class _FakePyPIClient:
+    # Project pages always 404; the JSON API lists ``releases[candidate]``.
+    # A ``gate`` holds every JSON request until the test sets it.
+    def __init__(
+        self,
+        releases: Mapping[str, Sequence[str]],
+        *,
+        etag: str | None = None,
+        gate: threading.Event | None = None,
+    ) -> None:
+        self.releases = releases
+        self.etag = etag
+        self.gate = gate
+        self.calls: list[_Call] = []
+        self.misuse: list[str] = []
+        self.closed = threading.Event()
+
+    def _record(self, method: str, url: str, headers: Mapping[str, str] | None) -> None:
+        if self.closed.is_set():
+            self.misuse.append(f"{method} {url}")
+        self.calls.append(_Call(method, url, headers, threading.get_ident()))
+
+    def head(self, url: str, headers: Mapping[str, str] | None = None) -> NoReturn:
+        self._record("HEAD", url, headers)
+        raise _FakeHttpError(404)
+
+    def get(self, url: str, headers: Mapping[str, str] | None = None) -> _FakeResponse:
+        self._record("GET", url, headers)
+        if self.gate is not None:
+            self.gate.wait()
+        if self.closed.is_set():
+            self.misuse.append(f"GET {url} answered after close")
+        if self.etag and headers and headers.get("If-None-Match") == self.etag:
+            return _FakeResponse(status=304)
+        candidate = url.rstrip("/").split("/")[-2]
+        versions = self.releases.get(candidate, ())
+        return _FakeResponse(
+            json={"releases": {version: [] for version in versions}},
+            headers={"ETag": self.etag} if self.etag else {},
+        )
+
+    def close(self) -> None:
+        self.closed.set()
+
+    def gets(self) -> list[_Call]:
+        return [call for call in self.calls if call.method == "GET"]
+
+
+class _FakeClock:
+    # Stands in for the ``time`` module: sleeping advances the clock instantly.
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += max(seconds, 0.0)
+
+
+@dataclass
+class _ClientPool:
+    releases: Mapping[str, Sequence[str]]
+    etag: str | None = None
+    gates: Mapping[int, threading.Event] = field(default_factory=dict)
+    created: list[_FakePyPIClient] = field(default_factory=list)
+
+    def __call__(self, *, timeout: float) -> _FakePyPIClient:
+        del timeout
+        # Candidates are created in order: underscore name, then hyphenated.
+        gate = self.gates.get(len(self.created))
+        client = _FakePyPIClient(self.releases, etag=self.etag, gate=gate)
+        self.created.append(client)
+        return client
+
+
+def _install_pool(
+    monkeypatch: SupportsMonkeyPatch, tmp_path: Path, pool: _ClientPool
+) -> _FakeClock:
+    clock = _FakeClock()
+    monkeypatch.setattr(publish_flow, "_RELEASE_CACHE_PATH", tmp_path / "seen.json")
+    monkeypatch.setattr(publish_flow, "HttpClient", pool)
+    monkeypatch.setattr(publish_flow, "time", clock)
+    return clock
+
+
+def _no_client(*_args: object, **_kwargs: object) -> NoReturn:
+    raise_failure("No client should be created")
+
+
+def test_wait_for_pypi_release_probes_shared_client_sequentially(
+    monkeypatch: SupportsMonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(publish_flow, "_RELEASE_CACHE_PATH", tmp_path / "seen.json")
+    monkeypatch.setattr(publish_flow, "HttpClient", _no_client)
+    shared = _FakePyPIClient({"x-make-demo-x": ["1.2.3"]})
+
+    available = publish_flow.wait_for_pypi_release(
+        "x_make_demo_x",
+        "1.2.3",
+        initial_delay=0,
+        client=cast("HttpClient", shared),
+    )
+
+    expect(condition=available, message="Hyphenated candidate lists the release")
+    expect(
+        condition={call.thread for call in shared.calls} == {threading.get_ident()},
+        message="A caller-owned client must only be used on the calling thread",
+    )
+    expect(
+        condition=not shared.closed.is_set(),
+        message="Caller-owned client must stay open",
+    )
+
+
+def test_wait_for_pypi_release_polls_candidates_concurrently(
+    monkeypatch: SupportsMonkeyPatch, tmp_path: Path
+) -> None:
+    pool = _ClientPool({"x-make-demo-x": ["1.2.3"]})
+    _install_pool(monkeypatch, tmp_path, pool)
+
+    available = publish_flow.wait_for_pypi_release(
+        "x_make_demo_x", "1.2.3", initial_delay=0
+    )
+
+    expect(condition=available, message="Hyphenated candidate lists the release")
+    expect(
+        condition=len(pool.created) == len(_CANDIDATES),
+        message="One client per candidate",
+    )
+    for client in pool.created:
+        expect(
+            condition=threading.get_ident() not in {c.thread for c in client.calls},
+            message="Owned clients are probed on the executor threads",
+        )
+        expect(
+            condition=client.closed.wait(timeout=5),
+            message="Owned clients are closed once their probe finishes",
+        )
+        expect(condition=not client.misuse, message=f"Misuse: {client.misuse}")
+
+
+def test_wait_for_pypi_release_replays_etag_as_if_none_match(
+    monkeypatch: SupportsMonkeyPatch, tmp_path: Path
+) -> None:
+    pool = _ClientPool({}, etag='"v1"')
+    _install_pool(monkeypatch, tmp_path, pool)
+
+    available = publish_flow.wait_for_pypi_release(
+        "x_make_demo_x", "1.2.3", timeout=3, initial_delay=0
+    )
+
+    expect(condition=not available, message="Unlisted release must time out")
+    for client in pool.created:
+        gets = client.gets()
+        expect(condition=len(gets) > 1, message="Expected a repeat JSON poll")
+        expect(condition=gets[0].headers is None, message="First poll is plain")
+        expect(
+            condition=all(
+                call.headers == {"If-None-Match": '"v1"'} for call in gets[1:]
+            ),
+            message="Repeat polls must send the remembered ETag",
+        )
+        expect(condition=client.closed.is_set(), message="Owned client not closed")
+
+
+def test_wait_for_pypi_release_closes_straggler_client_after_its_probe(
+    monkeypatch: SupportsMonkeyPatch, tmp_path: Path
+) -> None:
+    gate = threading.Event()
+    pool = _ClientPool({"x-make-demo-x": ["1.2.3"]}, gates={0: gate})
+    _install_pool(monkeypatch, tmp_path, pool)
+
+    try:
+        available = publish_flow.wait_for_pypi_release(
+            "x_make_demo_x", "1.2.3", initial_delay=0
+        )
+        straggler, answered = pool.created
+        expect(condition=available, message="Unblocked candidate lists the release")
+        expect(
+            condition=not straggler.closed.is_set(),
+            message="A client must stay open while its probe is in flight",
+        )
+    finally:
+        gate.set()
+    expect(
+        condition=straggler.closed.wait(timeout=5),
+        message="Straggler client is closed once its probe finishes",
+    )
+    expect(condition=answered.closed.is_set(), message="Idle client not closed")
+    expect(condition=not straggler.misuse, message=f"Misuse: {straggler.misuse}")
+
+
+def test_wait_for_pypi_release_times_out_on_blocked_probes(
+    monkeypatch: SupportsMonkeyPatch, tmp_path: Path
+) -> None:
+    gate = threading.Event()
+    pool = _ClientPool({"x-make-demo-x": ["1.2.3"]}, gates={0: gate, 1: gate})
+    _install_pool(monkeypatch, tmp_path, pool)
+
+    try:
+        available = publish_flow.wait_for_pypi_release(
+            "x_make_demo_x", "1.2.3", timeout=1, initial_delay=0
+        )
+        expect(condition=not available, message="Blocked probes must time out")
+        expect(
+            condition=not any(client.closed.is_set() for client in pool.created),
+            message="Clients with probes in flight must stay open",
+        )
+    finally:
+        gate.set()
+    for client in pool.created:
+        expect(condition=client.closed.wait(timeout=5), message="Client not closed")
+        expect(condition=not client.misuse, message=f"Misuse: {client.misuse}")
+
+
+def test_poll_candidates_reuses_in_flight_probe() -> None:
+    gate = threading.Event()
+    client = _FakePyPIClient({"x_make_demo_x": ["1.2.3"]}, gate=gate)
+    clients = {"x_make_demo_x": cast("HttpClient", client)}
+    in_flight: dict[str, Future[bool]] = {}
+    etags: dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=1) as executor:
+
+        def _poll(attempt_no: int, timeout: float) -> bool:
+            return publish_flow._poll_candidates(  # noqa: SLF001
+                executor,
+                clients,
+                package_name="x_make_demo_x",
+                version="1.2.3",
+                attempt_no=attempt_no,
+                etags=etags,
+                timeout=timeout,
+                in_flight=in_flight,
+            )
+
+        expect(condition=not _poll(1, 0.01), message="Blocked probe timed out")
+        expect(condition=not _poll(2, 0.01), message="Still blocked")
+        expect(
+            condition=len(client.gets()) == 1,
+            message="A running probe must not be started twice on its client",
+        )
+        gate.set()
+        expect(condition=_poll(3, 5.0), message="Carried-over probe result is used")
+    expect(condition=not in_flight, message="Consumed probes leave in_flight")
+
+
+def test_wait_for_pypi_release_uses_seen_release_cache(
+    monkeypatch: SupportsMonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    cache_path = tmp_path / "seen_releases.json"
+    monkeypatch.setattr(publish_flow, "_RELEASE_CACHE_PATH", cache_path)
+
+    publish_flow._remember_release("x_make_demo_x", "1.2.3")  # noqa: SLF001
+    monkeypatch.setattr(publish_flow, "HttpClient", _no_client)
+
+    expect(
+        condition=publish_flow.wait_for_pypi_release(
+            "x_make_demo_x", "1.2.3", initial_delay=0
+        ),
+        message="Cached release should be reported as available",
+    )
+    cached = cast("dict[str, float]", loads(cache_path.read_bytes()))
+    expect(
+        condition=set(cached) == {"x_make_demo_x==1.2.3"},
+        message="Cache should record the confirmed release",
+    )
+
+    stale = {"x_make_demo_x==1.2.3": 0.0}
+    cache_path.write_text(dumps(stale), encoding="utf-8")
+    expect(
+        condition=not publish_flow._release_already_seen(  # noqa: SLF001
+            "x_make_demo_x", "1.2.3"
+        ),
+        message="Entries older than the TTL should be ignored",
+    )
+
+
+def test_remember_release_removes_temp_file_when_swap_fails(
+    monkeypatch: SupportsMonkeyPatch, tmp_path: Path
+) -> None:
+    cache_path = tmp_path / ".cache" / "seen_releases.json"
+    monkeypatch.setattr(publish_flow, "_RELEASE_CACHE_PATH", cache_path)
+
+    def _failing_replace(_self: object, _target: object) -> NoReturn:
+        message = "replace refused"
+        raise OSError(message)
+
+    monkeypatch.setattr(pathlib.Path, "replace", _failing_replace)
+    publish_flow._remember_release("x_make_demo_x", "1.2.3")  # noqa: SLF001
+    leftovers = sorted(path.name for path in cache_path.parent.iterdir())
+    expect(
+        condition=not leftovers,
+        message=f"A failed swap must not leave temp files behind: {leftovers}",
+    )
+
+
+def _instantiate(
+    factory: object, safe_kwargs: dict[str, object]
+) -> publish_flow.PublisherProtocol:
+    return publish_flow._instantiate_publisher(  # noqa: SLF001
+        cast("publish_flow.PublisherFactory", factory),
+        "x_make_demo_x",
+        "1.2.3",
+        ctx=None,
+        safe_kwargs=safe_kwargs,
+    )
+
+
+def test_publisher_shape_cache_is_keyed_by_kwargs() -> None:
+    class AuthorPublisher:
+        def __init__(
+            self,
+            name: str,
+            version: str,
+            ctx: object | None = None,
+            author: str | None = None,
+        ) -> None:
+            self.name = name
+            self.version = version
+            self.ctx = ctx
+            self.author = author
+
+        def publish(self, main_rel_path: str, ancillary_rel_paths: list[str]) -> bool:
+            return bool(main_rel_path) or bool(ancillary_rel_paths)
+
+    # An unknown keyword only fits the positional shape ...
+    first = _instantiate(AuthorPublisher, {"author": "a", "force_publish": True})
+    expect(
+        condition=getattr(first, "author", "") is None,
+        message="Positional shape should not forward kwargs",
+    )
+    # ... which must not be reused for kwargs the keyword shape accepts.
+    second = _instantiate(AuthorPublisher, {"author": "b"})
+    expect(
+        condition=getattr(second, "author", None) == "b",
+        message="Keyword shape should forward author for the second entry",
+    )
+
+
+def test_publisher_shape_cache_never_repeats_failed_final_shape() -> None:
+    calls: list[object] = []
+
+    class KeywordOnlyPublisher:
+        def __init__(self, *, name: str, version: str, author: object) -> None:
+            calls.append(author)
+            if not isinstance(author, str):
+                message = "author must be a string"
+                raise TypeError(message)
+            self.name = name
+            self.version = version
+
+        def publish(self, main_rel_path: str, ancillary_rel_paths: list[str]) -> bool:
+            return bool(main_rel_path) or bool(ancillary_rel_paths)
+
+    _instantiate(KeywordOnlyPublisher, {"author": "a"})
+    calls.clear()
+    try:
+        _instantiate(KeywordOnlyPublisher, {"author": 1})
+    except TypeError:
+        pass
+    else:
+        raise_failure("Constructor TypeError should propagate")
+    expect(
+        condition=calls == [1],
+        message=f"Factory should run once for the failing entry, got {calls!r}",
+    )
+
+
+def _clear_path_caches() -> None:
+    publish_flow._realpath.cache_clear()  # noqa: SLF001
+    publish_flow._stat_kind.cache_clear()  # noqa: SLF001
+    publish_flow._list_dir.cache_clear()  # noqa: SLF001
+    publish_flow._listed_subdir.cache_clear()  # noqa: SLF001
+
+
+def _make_package(tmp_path: Path) -> Path:
+    pkg = tmp_path / "pkg"
+    (pkg / "docs").mkdir(parents=True)
+    (pkg / "README.md").write_text("readme\n", encoding="utf-8")
+    (pkg / "docs" / "guide.md").write_text("guide\n", encoding="utf-8")
+    objects = pkg / ".git" / "objects" / "ab"
+    objects.mkdir(parents=True)
+    for index in range(20):
+        (objects / f"{index:038x}").write_bytes(b"")
+    return pkg.resolve()
+
+
+def test_ancillary_probe_lists_only_the_directories_it_needs(
+    monkeypatch: SupportsMonkeyPatch, tmp_path: Path
+) -> None:
+    pkg = _make_package(tmp_path)
+    scanned: list[str] = []
+    real_scandir = os.scandir
+
+    def _recording_scandir(path: str) -> Iterator[os.DirEntry[str]]:
+        scanned.append(os.fspath(path))
+        return real_scandir(path)
+
+    _clear_path_caches()
+    monkeypatch.setattr(os, "scandir", _recording_scandir)
+
+    collected = publish_flow._collect_ancillary_files(  # noqa: SLF001
+        pkg, ["README.md", "docs/guide.md"]
+    )
+
+    expect(
+        condition=collected == ["README.md", "docs/guide.md"],
+        message=f"Unexpected ancillaries: {collected}",
+    )
+    expect(
+        condition=scanned == [os.fspath(pkg), os.fspath(pkg / "docs")],
+        message=f"Only probed directories should be listed, got {scanned}",
+    )
+
+
+def test_ancillary_allowlist_filters_and_dedupes_entries(tmp_path: Path) -> None:
+    pkg = _make_package(tmp_path)
+    (tmp_path / "outside.txt").write_text("outside\n", encoding="utf-8")
+    allowlist = pkg / "allow.txt"
+    allowlist.write_text(
+        "# comment\n"
+        "\n"
+        "@docs/guide.md\n"
+        "  README.md  \n"
+        "README.md\n"
+        "./docs//guide.md\n"
+        "docs\n"
+        "missing.txt\n"
+        "../outside.txt\n",
+        encoding="utf-8",
+    )
+    _clear_path_caches()
+
+    entries = publish_flow._load_ancillary_allowlist(  # noqa: SLF001
+        os.fspath(allowlist), os.fspath(pkg)
+    )
+
+    expect(
+        condition=entries == ["docs/guide.md", "README.md"],
+        message=f"Unexpected allowlist entries: {entries}",
+    )
+
+
+def test_ancillary_allowlist_resolves_dotdot_after_symlinks(tmp_path: Path) -> None:
+    pkg = _make_package(tmp_path)
+    deep = pkg / "sub" / "deep"
+    deep.mkdir(parents=True)
+    (pkg / "x.txt").write_text("top\n", encoding="utf-8")
+    (pkg / "sub" / "x.txt").write_text("nested\n", encoding="utf-8")
+    try:
+        (pkg / "link").symlink_to(deep, target_is_directory=True)
+    except OSError:
+        pytest.skip("symlinks are not available here")
+    allowlist = pkg / "allow.txt"
+    allowlist.write_text("link/../x.txt\n", encoding="utf-8")
+    _clear_path_caches()
+
+    entries = publish_flow._load_ancillary_allowlist(  # noqa: SLF001
+        os.fspath(allowlist), os.fspath(pkg)
+    )
+
+    # realpath resolves ``link`` first, so ``..`` lands in ``sub``, not ``pkg``.
+    expect(
+        condition=entries == ["sub/x.txt"],
+        message=f"'..' must be resolved through the symlink, got {entries}",
+    )
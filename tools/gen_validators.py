@@ -0,0 +1,303 @@
+"""Regenerate ``_contract_validators.py`` from ``json_contracts``.
+
+Run ``python tools/gen_validators.py`` after editing any contract schema.
+The contracts module refuses to use a stale file (fingerprint mismatch), so
+forgetting this step only costs the runtime compile, never correctness.
+
+Pass ``--cython`` to also compile the generated module into an in-place C
+extension (requires Cython and a C compiler). The extension shadows the ``.py``
+file on import and roughly halves validation time; it is a local build
+artefact and is never committed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import importlib.util
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+import fastjsonschema
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CONTRACTS_PATH = REPO_ROOT / "json_contracts.py"
+OUTPUT_PATH = REPO_ROOT / "_contract_validators.py"
+
+_HEADER_LINE = re.compile(
+    r"^(VERSION = .*|from decimal import Decimal|import re"
+    r"|from fastjsonschema import .*|NoneType = type\(None\))$"
+)
+_VALIDATE_NAME = re.compile(r"\bvalidate(?=\w*\()")
+_ENUM_GUARD = re.compile(
+    r"if not \((?P<clauses>isinstance\((?P<name>\w+), str\) and (?P=name) == '[^'\\]*'"
+    r"(?: or isinstance\((?P=name), str\) and (?P=name) == '[^'\\]*')+)\):"
+)
+_ENUM_MEMBER = re.compile(r"== '(?P<member>[^'\\]*)'")
+_REQUIRED_CHECK = re.compile(
+    r"^(?P<indent> *)(?P<missing>\w+__missing_keys) = set\((?P<keys>\[[^\]]*\])\)"
+    r" - (?P<source>\w+)\.keys\(\)\n(?P=indent)if (?P=missing):$",
+    re.MULTILINE,
+)
+_KEY_SET = re.compile(
+    r"^(?P<indent> *)(?P<name>\w+_keys) = set\((?P<source>\w+)\.keys\(\)\)$",
+    re.MULTILINE,
+)
+
+
+def _load_contracts() -> ModuleType:
+    # Load by path so regeneration does not need the orchestrator packages
+    # that the package ``__init__`` pulls in.
+    spec = importlib.util.spec_from_file_location("_json_contracts", CONTRACTS_PATH)
+    if spec is None or spec.loader is None:
+        message = f"Cannot load contracts from {CONTRACTS_PATH}"
+        raise ImportError(message)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _closed_object_guard(name: str) -> re.Pattern[str]:
+    return re.compile(
+        rf"^(?P<indent> *)if {name}:\n"
+        rf'(?P<raise> *raise .* must not contain "\+str\({name}\)\+.*)$',
+        re.MULTILINE,
+    )
+
+
+def _hoist_allowed_keys(kind: str, body: str) -> str:
+    """Check closed objects against a frozenset instead of draining a key copy.
+
+    fastjsonschema copies every instance's keys into a set and removes each
+    known property before testing for leftovers. For ``additionalProperties:
+    false`` objects the known keys are fixed, so a keys-view membership test
+    plus one set difference against a module-level frozenset is equivalent.
+    """
+    constants: list[str] = []
+    functions = body.split("\ndef ")
+    for index, function in enumerate(functions):
+        rewritten = function
+        for match in _KEY_SET.finditer(function):
+            name = match["name"]
+            guard = _closed_object_guard(name).search(rewritten)
+            if guard is None:
+                continue
+            removal = re.compile(
+                rf'^ *{name}\.remove\("(?P<key>[^"]+)"\)\n', re.MULTILINE
+            )
+            allowed = tuple(found["key"] for found in removal.finditer(rewritten))
+            constant = f"_{kind.upper()}_ALLOWED_KEYS_{len(constants)}"
+            constants.append(f"{constant} = frozenset({allowed!r})")
+            indent = guard["indent"]
+            raise_line = guard["raise"].replace(f"str({name})", f"str({name}_unknown)")
+            rewritten = (
+                rewritten[: guard.start()]
+                + f"{indent}{name}_unknown = {name} - {constant}\n"
+                + f"{indent}if {name}_unknown:\n{raise_line}"
+                + rewritten[guard.end() :]
+            )
+            rewritten = removal.sub("", rewritten)
+            rewritten = rewritten.replace(
+                match[0], f"{match['indent']}{name} = {match['source']}.keys()"
+            )
+        functions[index] = rewritten
+    return "\n".join(constants) + "\n\n" + "\ndef ".join(functions)
+
+
+def _hoist_required(kind: str, body: str) -> str:
+    """Test required keys with one keys-view comparison against a frozenset.
+
+    fastjsonschema builds a fresh set from a list literal and subtracts the
+    instance keys on every call. ``keys() >= frozenset`` probes each required
+    key without allocating; the difference is only computed to report a miss.
+    """
+    constants: dict[tuple[str, ...], str] = {}
+
+    def _replace(match: re.Match[str]) -> str:
+        keys = tuple(cast("list[str]", ast.literal_eval(match["keys"])))
+        constant = constants.setdefault(
+            keys, f"_{kind.upper()}_REQUIRED_{len(constants)}"
+        )
+        indent, source = match["indent"], match["source"]
+        return (
+            f"{indent}if not {source}.keys() >= {constant}:\n"
+            f"{indent}    {match['missing']} = {constant} - {source}.keys()"
+        )
+
+    body = _REQUIRED_CHECK.sub(_replace, body)
+    declarations = [
+        f"{constant} = frozenset({keys!r})" for keys, constant in constants.items()
+    ]
+    return "\n".join(declarations) + "\n" + body if declarations else body
+
+
+def _hoist_enums(kind: str, body: str) -> str:
+    """Replace chained multi-member string-enum comparisons with a frozenset.
+
+    fastjsonschema emits ``isinstance(v, str) and v == 'a' or ...`` per member;
+    a module-level frozenset turns that linear scan into a single hash probe.
+    """
+    constants: dict[tuple[str, ...], str] = {}
+
+    def _replace(match: re.Match[str]) -> str:
+        members = tuple(
+            found["member"] for found in _ENUM_MEMBER.finditer(match["clauses"])
+        )
+        constant = constants.setdefault(
+            members, f"_{kind.upper()}_ENUM_{len(constants)}"
+        )
+        name = match["name"]
+        return f"if not (isinstance({name}, str) and {name} in {constant}):"
+
+    body = _ENUM_GUARD.sub(_replace, body)
+    declarations = [
+        f"{constant} = frozenset({members!r})"
+        for members, constant in constants.items()
+    ]
+    return "\n".join(declarations) + "\n" + body if declarations else body
+
+
+def _literal_end(text: str, start: int) -> int:
+    """Return the index just past the bracketed literal opening at ``start``."""
+    depth = 0
+    index = start
+    while True:
+        char = text[index]
+        if char in "'\"":
+            index += 1
+            while text[index] != char:
+                index += 2 if text[index] == "\\" else 1
+        elif char in "{[(":
+            depth += 1
+        elif char in "}])":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+
+
+def _drop_definitions(body: str) -> str:
+    """Strip the schema fragment fastjsonschema embeds in every raise.
+
+    Each failure branch carries a dict literal of the sub-schema it checked,
+    which is most of the generated module's size. ``json_contracts`` reports
+    only the message, path, and rule, so the literals only inflate the code
+    objects and the first-use import.
+    """
+    parts: list[str] = []
+    position = 0
+    marker = "definition="
+    while (found := body.find(marker, position)) != -1:
+        literal_start = found + len(marker)
+        parts.append(body[position:literal_start] + "None")
+        position = _literal_end(body, literal_start)
+    parts.append(body[position:])
+    return "".join(parts)
+
+
+def _render_validator(
+    kind: str, schema: dict[str, object], formats: dict[str, object]
+) -> str:
+    code = cast("str", fastjsonschema.compile_to_code(schema, formats=formats))
+    body = "\n".join(line for line in code.splitlines() if not _HEADER_LINE.match(line))
+    body = _VALIDATE_NAME.sub(f"validate_{kind}", body)
+    body = body.replace("REGEX_PATTERNS", f"_{kind.upper()}_REGEX_PATTERNS")
+    body = _drop_definitions(body.strip())
+    body = _hoist_required(kind, _hoist_enums(kind, body))
+    return _hoist_allowed_keys(kind, body)
+
+
+def render(contracts: ModuleType) -> str:
+    schemas = cast("dict[str, dict[str, object]]", contracts._CONTRACTS)  # noqa: SLF001
+    runtime = {
+        kind: cast(
+            "dict[str, object]",
+            contracts._runtime_schema(schema),  # noqa: SLF001
+        )
+        for kind, schema in schemas.items()
+    }
+    fingerprints = {
+        kind: cast("str", contracts._schema_fingerprint(schema))  # noqa: SLF001
+        for kind, schema in runtime.items()
+    }
+    sections = [
+        '"""Contract validators generated by tools/gen_validators.py. Do not edit."""',
+        "# mypy: ignore-errors",
+        "# ruff: noqa",
+        "# fmt: off",
+        "import re",
+        "from decimal import Decimal",
+        "",
+        "from fastjsonschema import (",
+        "    JsonSchemaValueException,",
+        "    JsonSchemaValuesException,",
+        ")",
+        "",
+        f'FASTJSONSCHEMA_VERSION = "{fastjsonschema.VERSION}"',
+        f"SCHEMA_FINGERPRINTS = {fingerprints!r}",
+        "",
+        "NoneType = type(None)",
+    ]
+    formats = cast("dict[str, object]", contracts._FORMATS)  # noqa: SLF001
+    sections.extend(
+        f"\n\n{_render_validator(kind, schema, formats)}"
+        for kind, schema in runtime.items()
+    )
+    return "\n".join(sections) + "\n"
+
+
+def _remove_extensions() -> None:
+    # A built extension shadows the regenerated .py file, so drop it rather
+    # than leave imports on the previous schema (the fingerprint check would
+    # reject it, losing the pre-generated path entirely).
+    for pattern in (f"{OUTPUT_PATH.stem}.*.so", f"{OUTPUT_PATH.stem}.*.pyd"):
+        for extension in REPO_ROOT.glob(pattern):
+            extension.unlink()
+
+
+def _cythonize() -> None:
+    if importlib.util.find_spec("Cython") is None:
+        message = "--cython requires Cython: python -m pip install cython"
+        raise SystemExit(message)
+    with tempfile.TemporaryDirectory() as build_dir:
+        subprocess.run(  # noqa: S603 - fixed argv, shell=False
+            [
+                sys.executable,
+                "-m",
+                "Cython.Build.Cythonize",
+                "-i",
+                "-3",
+                str(OUTPUT_PATH),
+            ],
+            check=True,
+            cwd=build_dir,
+        )
+    OUTPUT_PATH.with_suffix(".c").unlink(missing_ok=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Regenerate _contract_validators.py")
+    parser.add_argument(
+        "--cython",
+        action="store_true",
+        help="also build the generated module as an in-place C extension",
+    )
+    args = parser.parse_args(argv)
+    OUTPUT_PATH.write_text(render(_load_contracts()), encoding="utf-8")
+    sys.stdout.write(f"Wrote {OUTPUT_PATH}\n")
+    _remove_extensions()
+    if args.cython:
+        _cythonize()
+        sys.stdout.write(f"Built C extension for {OUTPUT_PATH.name}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
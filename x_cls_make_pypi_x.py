@@ -11,8 +11,8 @@ import shutil
 import subprocess as _subprocess
 import sys
 import sys as _sys
+import tempfile
 import urllib.request
-import uuid
 from collections.abc import Mapping, Sequence
 from contextlib import contextmanager, suppress
 from dataclasses import dataclass
@@ -28,8 +28,13 @@ if TYPE_CHECKING:
 from jsonschema import ValidationError
 
 from x_0_make_all_x.manifest import ManifestEntry, ManifestOptions
-from x_make_common_x.json_contracts import validate_payload
-from x_make_pypi_x.json_contracts import ERROR_SCHEMA, INPUT_SCHEMA, OUTPUT_SCHEMA
+from x_make_pypi_x.json_contracts import (
+    dumps,
+    loads,
+    validate_error,
+    validate_input,
+    validate_output,
+)
 from x_make_pypi_x.publish_flow import PublisherFactory, publish_manifest_entries
 
 _LOGGER = logging.getLogger("x_make")
@@ -154,6 +159,18 @@ def _safe_urlopen(url: str, *, timeout: float) -> Iterator[IO[bytes]]:
         response.close()
 
 
+def _stage_file(src: Path, dest: Path) -> None:
+    # Hardlink into the build tree when source and build dir share a
+    # filesystem; nothing writes to staged files in place, so the link is as
+    # good as a copy. Unlink first so a stale entry (or an earlier link) is
+    # replaced rather than written through.
+    dest.unlink(missing_ok=True)
+    try:
+        dest.hardlink_to(src)
+    except OSError:
+        shutil.copy2(src, dest)
+
+
 class XClsMakePypiX(BaseMake):
     # Configurable endpoints and env names
     PYPI_INDEX_URL: str = "https://pypi.org"
@@ -166,8 +183,7 @@ class XClsMakePypiX(BaseMake):
             url = f"{self.PYPI_INDEX_URL}/pypi/{self.name}/json"
             with _safe_urlopen(url, timeout=10) as response:
                 response_bytes = response.read()
-            payload_text = response_bytes.decode("utf-8")
-            payload_raw: object = json.loads(payload_text)
+            payload_raw: object = loads(response_bytes)
         except (
             HTTPError,
             URLError,
@@ -340,7 +356,7 @@ class XClsMakePypiX(BaseMake):
             with suppress(OSError):
                 pyproject.write_text(txt, encoding="utf-8")
 
-    def create_files(  # noqa: C901, PLR0912, PLR0915
+    def create_files(  # noqa: C901, PLR0912
         self,
         main_file: str,
         ancillary_files: list[str],
@@ -352,8 +368,9 @@ class XClsMakePypiX(BaseMake):
         package_name = self.name
         repo_build_root = Path(__file__).resolve().parent / "_build_temp_x_pypi_x"
         repo_build_root.mkdir(parents=True, exist_ok=True)
-        build_dir = repo_build_root / f"_build_{package_name}_{uuid.uuid4().hex}"
-        build_dir.mkdir(parents=True, exist_ok=True)
+        build_dir = Path(
+            tempfile.mkdtemp(prefix=f"_build_{package_name}_", dir=repo_build_root)
+        )
         package_dir = build_dir / package_name
         if package_dir.exists():
             if package_dir.is_dir():
@@ -363,7 +380,7 @@ class XClsMakePypiX(BaseMake):
         package_dir.mkdir(parents=True, exist_ok=True)
 
         main_path = Path(main_file)
-        shutil.copy2(main_path, package_dir / main_path.name)
+        _stage_file(main_path, package_dir / main_path.name)
         init_path = package_dir / "__init__.py"
         if not init_path.exists():
             init_path.write_text("# Package init\n", encoding="utf-8")
@@ -385,7 +402,7 @@ class XClsMakePypiX(BaseMake):
             if src_path.is_file() and _is_allowed(str(src_path)):
                 dest_path = package_dir / rel_norm
                 dest_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src_path, dest_path)
+                _stage_file(src_path, dest_path)
 
         # Ensure lightweight stub files (.pyi) exist for typing in every
         # package directory and for each copied module. These are minimal
@@ -546,7 +563,7 @@ def _failure_payload(
     if details:
         payload["details"] = {str(key): value for key, value in details.items()}
     with suppress(ValidationError):
-        validate_payload(payload, ERROR_SCHEMA)
+        validate_error(payload)
     return payload
 
 
@@ -656,7 +673,7 @@ def _build_context(
 
 def _validate_input_schema(payload: Mapping[str, object]) -> dict[str, object] | None:
     try:
-        validate_payload(payload, INPUT_SCHEMA)
+        validate_input(payload)
     except ValidationError as exc:
         return _failure_payload(
             "input payload failed validation",
@@ -779,8 +796,8 @@ def main_json(  # noqa: PLR0911 - routing handles multiple exit paths explicitly
         return _failure_payload("publishing manifest entries failed", details=details)
 
     try:
-        report_text = Path(report_path).read_text(encoding="utf-8")
-        result_payload_raw: object = json.loads(report_text)
+        report_bytes = Path(report_path).read_bytes()
+        result_payload_raw: object = loads(report_bytes)
     except (OSError, json.JSONDecodeError) as exc:
         return _failure_payload(
             "failed to read run report",
@@ -804,7 +821,7 @@ def main_json(  # noqa: PLR0911 - routing handles multiple exit paths explicitly
 
     outputs: dict[str, object] = dict(result_payload)
     try:
-        validate_payload(outputs, OUTPUT_SCHEMA)
+        validate_output(outputs)
     except ValidationError as exc:
         return _failure_payload(
             "generated output failed schema validation",
@@ -819,7 +836,7 @@ def main_json(  # noqa: PLR0911 - routing handles multiple exit paths explicitly
 
 def _load_json_payload(file_path: str | None) -> Mapping[str, object]:
     def _load(stream: IO[str]) -> Mapping[str, object]:
-        payload_obj: object = json.load(stream)
+        payload_obj: object = loads(stream.read())
         if not isinstance(payload_obj, Mapping):
             message = "JSON payload must be a mapping"
             raise TypeError(message)
@@ -850,7 +867,7 @@ def _run_json_cli(args: Sequence[str]) -> None:
 
     payload = _load_json_payload(json_file_arg if json_file_arg else None)
     result = main_json(payload)
-    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write(dumps(result, pretty=True))
     sys.stdout.write("\n")
 
 